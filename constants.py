@@ -17,6 +17,19 @@ except Exception:  # seems to be so dependent on system and versions, easier to
 DISPLAY_NAME = "Conqueror of Empires"
 DISPLAY_SIZE = [1000, 700]
 
+# Frame pacing for every scene loop
+FPS = 60
+IDLE_TIMEOUT = 250  # ms, longest a scene waits for input when nothing on screen is changing
+
+# Saves
+SAVE_COMPACT_INTERVAL = 20  # delta saves appended before the game is rewritten as one full save
+
+# Replays
+KEYFRAME_INTERVAL = 100  # commands between the full snapshots a replay seeks from
+
+# Background
+STAR_LAYERS = 1  # parallax layers of the in-game starscape, 1 keeps it still while the camera scrolls
+
 # Map Config
 MAP_SIZE = [20, 20]  # ? might not be
 
@@ -135,6 +148,15 @@ LEVELS = [
     [],  # 5 is max
 ]
 
+# Computer players. budget is seconds of search per turn, depth is how many commands ahead each choice looks and
+# width is how many of the most promising commands are looked at each step of the search. nodes is the budget as
+# evaluations instead, about the same search, used by tournaments so games play the same on any machine.
+AI_DIFFICULTIES = {
+    "easy": {"budget": 0.5, "nodes": 10000, "depth": 1, "width": 1},
+    "normal": {"budget": 1.5, "nodes": 30000, "depth": 2, "width": 4},
+    "hard": {"budget": 3, "nodes": 60000, "depth": 3, "width": 6},
+}
+
 
 # Cleanup unneeded to not pollute namespace.
 del x, y, width, height, MAP_PADDING
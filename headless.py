@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# Plays a game from a stream of commands without opening a display, ie for simulations and benchmarks.
+# Commands are json lists, one per line. ie: ["spawn", "scout", [2, 2]], ["move", [2, 2], [3, 2]], ["end_turn"]
+
+import argparse
+import json
+import sys
+
+import project.game.engine as engine
+import project.game.commands as commands
+import project.game.delta as delta
+import project.game.journal as journal
+
+PLAYER_COLOURS = ["blue", "yellow", "green", "red"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play a game from a stream of commands, without a display.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--game", help="saved game to load")
+    source.add_argument("--map", help="map to start a new game on")
+    parser.add_argument("--players", nargs="+", default=["player 1", "player 2"], help="player names for a new game")
+    parser.add_argument("--seed", type=int, help="seed for a new game's spawns and city names")
+    parser.add_argument("--save-as", help="save the game once the commands are applied")
+    parser.add_argument("commands", nargs="?", type=argparse.FileType("r"), default=sys.stdin,
+                        help="file of commands (default: stdin)")
+    args = parser.parse_args()
+
+    if args.game is not None:
+        game = engine.load(args.game)
+    else:
+        if not 1 < len(args.players) <= len(PLAYER_COLOURS):
+            parser.error("a new game needs 2 to %s players" % len(PLAYER_COLOURS))
+        game = engine.make(args.map, [{"name": name, "colour": colour}
+                                      for name, colour in zip(args.players, PLAYER_COLOURS)], seed=args.seed)
+
+    applied = game.run(read_commands(args.commands, parser))
+
+    game_model = game.get_model()
+    print("commands applied: %s" % applied)
+    for player in game_model.players:
+        print("%s: turn %s, score %s, cities %s, units %s%s" % (
+            player.get_name(), player.get_turn(), player.get_score(), len(player.settlements), len(player.units),
+            " (dead)" if player.is_dead() else ""))
+    if game_model.game_ended():
+        print("winner: %s" % game_model.get_winner())
+
+    if args.save_as is not None:
+        game_model.game_name = args.save_as
+        delta.compact(game_model, args.save_as)
+        journal.delete(args.save_as)  # an overwritten game's journal doesn't lead on to this save
+
+
+def read_commands(lines, parser):
+    """ the command on each line, stopping the run at the first line that isn't one, before anything is saved """
+    for number, line in enumerate(lines, 1):
+        if line.strip():
+            try:
+                yield commands.from_data(json.loads(line))
+            except (KeyError, IndexError, TypeError, ValueError):  # json errors are ValueErrors
+                parser.error("line %s isn't a command: %s" % (number, line.strip()))
+
+
+if __name__ == "__main__":
+    main()
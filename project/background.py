@@ -12,14 +12,47 @@ class Star:
 
 
 class Starscape:
-    def __init__(self, rect):
+    """ stars pre-rendered once to surfaces, optionally split into parallax layers which scroll with an offset """
+    def __init__(self, rect, layers=1, parallax=0.2, seed=None):
+        self.rect = pygame.Rect(rect)
+        self.seed = seed  # the same seed always places the same stars, None for different stars each time
+        self.parallax = parallax  # scroll speed of the nearest layer relative to the offset, furthest layer is still
+        self.stars = []
+        self.layers = [None] * layers
+        self.generate()
+
+    def generate(self):
+        rng = random.Random(self.seed)
         self.stars = []
-        amount = round(rect[2]*rect[3]*0.001)  # area * % cover of area (approx)
+        amount = round(self.rect[2]*self.rect[3]*0.001)  # area * % cover of area (approx)
         for i in range(amount):
-            size = random.randint(1, 2)
-            x, y = random.randint(rect[0], rect[2]), random.randint(rect[1], rect[3])
+            size = rng.randint(1, 2)
+            x, y = rng.randint(self.rect[0], self.rect[2]), rng.randint(self.rect[1], self.rect[3])
             self.stars.append(Star([x, y, size, size]))
 
-    def draw(self, display):
-        for item in self.stars:
-            item.draw(display)
+        for index in range(len(self.layers)):
+            layer = pygame.Surface(self.rect.size)
+            if index > 0:
+                layer.set_colorkey((0, 0, 0))  # nearer layers are drawn over the furthest
+            for star in self.stars[index::len(self.layers)]:
+                star.draw(layer)
+            self.layers[index] = layer
+
+    def resize(self, rect):
+        self.rect = pygame.Rect(rect)
+        self.generate()
+
+    def draw(self, display, offset=(0, 0)):
+        if display.get_size() != self.rect.size:
+            self.resize(display.get_rect())
+
+        for index, layer in enumerate(self.layers):
+            speed = self.parallax * index / max(len(self.layers) - 1, 1)
+            x = round(offset[0] * speed) % self.rect.width
+            y = round(offset[1] * speed) % self.rect.height
+            if x == 0 and y == 0:
+                display.blit(layer, [0, 0])
+            else:  # wrap layer round, so it always covers the display
+                for layer_x in [x - self.rect.width, x]:
+                    for layer_y in [y - self.rect.height, y]:
+                        display.blit(layer, [layer_x, layer_y])
@@ -1 +1,2 @@
-from project.control.controller import *
\ No newline at end of file
+from project.control.controller import *
+from project.control.scenes import *
@@ -3,6 +3,7 @@ import paths
 
 import pygame
 import project.menus as menus
+import project.control.scenes as scenes
 import project.game.controller as game
 
 
@@ -23,6 +24,12 @@ class ApplicationController:
         # General Setup
         self.state = "menu"
         self.game_reference = None
+        self.scenes = scenes.SceneManager(self.display, {
+            "menu": menus.Menu,
+            "load_game": menus.LoadGame,
+            "new_game": menus.NewGame,
+            "leaderboard": menus.Leaderboard,
+        })  # menus are kept between visits, games are made for each play
 
     def run(self):
         while self.state != "quit":
@@ -47,21 +54,21 @@ class ApplicationController:
         self.quit()
 
     def run_menu(self):
-        menu = menus.Menu(self.display)  # takes control while section running, control returns here after.
+        menu = self.scenes.run("menu")  # takes control while section running, control returns here after.
         self.state = menu.get_state()
 
     def run_loadgame(self):
-        load_game = menus.LoadGame(self.display)
+        load_game = self.scenes.run("load_game")
         self.state = load_game.get_state()
         self.game_reference = load_game.get_game()
 
     def run_newgame(self):
-        new_game = menus.NewGame(self.display)
+        new_game = self.scenes.run("new_game")
         self.state = new_game.get_state()
         self.game_reference = new_game.get_game()
 
     def run_leaderboard(self):
-        leaderboard = menus.Leaderboard(self.display)
+        leaderboard = self.scenes.run("leaderboard")
         self.state = leaderboard.get_state()
 
     def run_game(self):
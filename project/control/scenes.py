@@ -0,0 +1,19 @@
+class SceneManager:
+    """ makes each scene the first time it is switched to, then keeps it, so switching back reuses all it loaded """
+    def __init__(self, display, scene_types):
+        self.display = display
+        self.scene_types = scene_types  # {state: project.scene.Scene subclass, made with the display}
+        self.scenes = {}
+
+    def get_scene(self, state):
+        if state not in self.scenes:
+            self.scenes[state] = self.scene_types[state](self.display)
+        return self.scenes[state]
+
+    def run(self, state):
+        """ switches to the scene of state, returning it once it has run and been left """
+        scene = self.get_scene(state)
+        scene.enter()
+        scene.run()
+        scene.exit()
+        return scene
@@ -1,30 +1,143 @@
-# Currently using JSON as method of file save
+# Currently using JSON as method of file save, except game saves which are packed by project.game.savefile
+# Writes are made in order by a background thread, so saving never waits on the disk. Anything reading saved files
+# must call flush() first (load and check_exists do), so it sees every write asked for so far.
 
+import atexit
 import json
 import os
+import threading
 
 import constants
 
 
 def save(data, filename):
-    with open(filename + ".json", "w") as file:
-        json.dump(data, file, indent=2)
+    """ data is written later, so must not be changed after. Model.get_save_data is safe, as it builds new lists """
+    writer.put("save", filename + ".json", [encode_json, data])
+
+
+def save_encoded(data, filename, encode):
+    """ as save, to filename as given, encode turning data into the bytes written (on the writer thread) """
+    writer.put("save", filename, [encode, data])
+
+
+def append(text, filename):
+    writer.put("append", filename, text)
 
 
 def load(filename):
+    flush()
     with open(filename + ".json", "r") as file:
         data = json.load(file)
     return data
 
 
 def delete(filename):
-    os.remove(filename + ".json")
+    writer.put("delete", filename + ".json")
+
+
+def remove(filename):  # as delete, for files not saved by save (ie appended to), so without the .json extension
+    writer.put("delete", filename)
 
 
 def check_exists(filename):
+    flush()
     return os.path.isfile(filename)
 
 
+def flush():
+    """ waits for every write asked for so far """
+    writer.flush()
+
+
+def encode_json(data):
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def write_atomic(filename, content):
+    """ the file is either left as it was or completely replaced, even if the program is killed while writing """
+    temp_filename = filename + ".tmp"
+    with open(temp_filename, "wb") as file:
+        file.write(content)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_filename, filename)
+
+
+class SaveWriter:
+    """ writes files on a background thread, in the order they were asked for. A write still waiting is joined by
+    the next one to the same file (if nothing else was asked of that file between), so bursts are written once. """
+    def __init__(self):
+        self.jobs = []  # [action, filename, content], oldest first
+        self.busy = False  # a job has been taken and is being written
+        self.error = None  # raised again on the main thread at the next flush
+        self.condition = threading.Condition()
+        self.thread = None
+
+    def put(self, action, filename, content=None):
+        with self.condition:
+            last_job = self.get_last_job(filename)
+            if last_job is not None and last_job[0] == action == "save":
+                last_job[2] = content  # only the newest save is worth writing
+            elif last_job is not None and last_job[0] == action == "append":
+                last_job[2] += content
+            else:
+                self.jobs.append([action, filename, content])
+
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, daemon=True)  # flushed at exit, see below
+                self.thread.start()
+            self.condition.notify_all()
+
+    def get_last_job(self, filename):
+        for job in reversed(self.jobs):
+            if job[1] == filename:
+                return job
+        return None
+
+    def flush(self):
+        with self.condition:
+            while self.jobs or self.busy:
+                self.condition.wait()
+            error, self.error = self.error, None
+        if error is not None:
+            raise error
+
+    def run(self):
+        while True:
+            with self.condition:
+                while not self.jobs:
+                    self.condition.wait()
+                action, filename, content = self.jobs.pop(0)
+                self.busy = True
+
+            try:
+                write(action, filename, content)
+            except Exception as error:
+                self.error = error
+            finally:
+                with self.condition:
+                    self.busy = False
+                    self.condition.notify_all()
+
+
+def write(action, filename, content):
+    if action == "save":
+        encode, save_data = content
+        write_atomic(filename, encode(save_data))
+    elif action == "append":
+        with open(filename, "a") as file:
+            file.write(content)
+            file.flush()
+            os.fsync(file.fileno())
+    elif action == "delete":
+        if os.path.isfile(filename):
+            os.remove(filename)
+
+
+writer = SaveWriter()
+atexit.register(flush)  # the writer thread is a daemon, so nothing asked for is lost when the program exits
+
+
 def load_map_format(map_file):
     with open(map_file, "r") as file:
         grid = file.read().split("\n")
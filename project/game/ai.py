@@ -0,0 +1,238 @@
+# Computer players. A turn is planned with the headless engine, looking ahead with make/unmake, so it never needs
+# pygame and can be planned for headless games as well as in the GUI.
+
+import copy
+import threading
+import time
+
+import constants
+import project.game.model as model
+import project.game.engine as engine
+import project.game.commands as commands
+
+# Evaluation weights, everything is valued relative to 1 ap.
+CITY_VALUE = 30  # holding a city, on top of its level
+LEVEL_VALUE = 10  # each city level, as it raises ap per turn
+SUB_LEVEL_VALUE = 2.5  # progress to the next level, a little over its cost so spare ap is spent
+UNIT_VALUE = 1.5  # times a unit's spawn cost at full health, so spawning beats saving ap
+READY_VALUE = 8  # a unit standing in a city it could conquer next turn
+DISTANCE_VALUE = 0.5  # lost for each step a unit is from the nearest city it could conquer
+
+
+def plan_turn(save_data, difficulty, budget=None, nodes=None):
+    """ returns the commands the current player of save_data should make this turn, ending with EndTurn.
+    budget overrides the difficulty's seconds of search, ie to play quicker simulations. nodes instead limits
+    the search to that many evaluations, so the same game always gets the same plan, whatever the machine """
+    return Planner(engine.Engine(model.Model(save_data)), difficulty, budget, nodes).plan()
+
+
+class TurnWorker:
+    """ plans the current player's turn on a worker thread, from a copy of the game so it can still be drawn """
+    def __init__(self, game_model):
+        save_data = copy.deepcopy(game_model.get_save_data())  # shares nothing with the model being drawn
+        self.planner = Planner(engine.Engine(model.Model(save_data)), game_model.get_current_player().get_ai())
+        self.plan = None
+        self.error = None
+
+        self.thread = threading.Thread(target=self.run, daemon=True)  # never keeps a closed game running
+        self.thread.start()
+
+    def run(self):
+        try:
+            self.plan = self.planner.plan()
+        except Exception as error:  # raised again from get_plan, on the main thread where it can't be missed
+            self.error = error
+
+    def is_done(self):
+        return not self.thread.is_alive()
+
+    def get_progress(self):
+        return self.planner.get_progress()
+
+    def get_plan(self):
+        if self.error is not None:
+            raise self.error
+        return self.plan
+
+
+class Planner:
+    """ picks a command at a time, by iterative deepening over what else the player could do this turn """
+    def __init__(self, game_engine, difficulty, budget=None, nodes=None):
+        self.engine = game_engine
+        self.model = game_engine.get_model()
+        self.player = self.model.get_current_player()
+
+        settings = constants.AI_DIFFICULTIES[difficulty]
+        self.nodes = nodes  # if given, the budget is evaluations rather than seconds
+        if nodes is not None:
+            self.budget = nodes
+        else:
+            self.budget = settings["budget"] if budget is None else budget
+        self.depth = settings["depth"]
+        self.width = settings["width"]
+        self.evaluations = 0
+        self.deadline = None  # in the units of clock
+
+        self.cities = [tile for row in self.model.world.tiles for tile in row if tile.get_type() == "c"]
+        self.distances = {}  # target city positions: {position: steps to nearest target}, targets change rarely
+
+    def plan(self):
+        self.deadline = self.clock() + self.budget
+
+        plan = []
+        while not self.model.game_ended():
+            if self.clock() > self.deadline:
+                plan.extend(self.hurry())
+                break
+
+            command = self.choose()
+            if command is None:
+                break
+            self.engine.apply(command)
+            plan.append(command)
+
+        if not self.model.game_ended():
+            plan.append(commands.EndTurn())
+        return plan
+
+    def clock(self):
+        """ budget spent so far, seconds or evaluations made """
+        if self.nodes is not None:
+            return self.evaluations
+        return time.perf_counter()
+
+    def get_progress(self):
+        """ fraction of the budget used so far, 0 to 1 """
+        if self.deadline is None:
+            return 0
+        return min(1, 1 - (self.deadline - self.clock()) / self.budget)
+
+    def hurry(self):
+        """ out of budget, so makes every command that looked better than stopping, without looking again """
+        made = []
+        value = self.evaluate()
+        for command_value, command in self.rank():
+            if command_value <= value:
+                break
+            if self.engine.apply(command):  # earlier commands might have made it illegal
+                made.append(command)
+        return made
+
+    def get_decision_budget(self):
+        """ shares the budget left between the units and cities still to act """
+        pending = len([unit for unit in self.player.units if not unit.has_moved() or not unit.has_attacked()])
+        pending += len(self.player.settlements)
+        return (self.deadline - self.clock()) / (pending + 1)
+
+    def choose(self):
+        """ the best command to make next, or None if ending the turn is best """
+        deadline = self.clock() + self.get_decision_budget()
+
+        ranked = self.rank()  # looking 1 command ahead
+        for depth in range(2, self.depth + 1):
+            results = self.search_ranked(ranked[:self.width], depth, deadline)
+            if results is None:
+                break  # out of budget, only a finished depth is trusted
+            ranked[:self.width] = results  # so the best so far is searched first at the next depth
+
+        if ranked and ranked[0][0] > self.evaluate():  # else ending the turn is best
+            return ranked[0][1]
+        return None
+
+    def search_ranked(self, ranked, depth, deadline):
+        """ re-ranks commands by searching depth commands ahead, None if out of budget """
+        results = []
+        for command_value, command in ranked:
+            self.engine.make(command)
+            result = self.search(depth - 1, deadline)
+            self.engine.unmake()
+            if result is None:
+                return None
+            results.append([result, command])
+        results.sort(key=lambda result: result[0], reverse=True)
+        return results
+
+    def search(self, depth, deadline):
+        """ best value the player can reach with up to depth more commands, None if out of budget """
+        value = self.evaluate()
+        if self.clock() > deadline:
+            return None
+
+        ranked = self.rank()
+        if not ranked:
+            return value
+        if depth == 1:
+            return max(value, ranked[0][0])
+
+        for command_value, command in ranked[:self.width]:
+            self.engine.make(command)
+            result = self.search(depth - 1, deadline)
+            self.engine.unmake()
+            if result is None:
+                return None
+            value = max(value, result)
+        return value
+
+    def rank(self):
+        """ [[value, command]] for each of the players commands this turn, best first """
+        ranked = []
+        for command in list(self.model.legal_actions()):  # listed first, as the model changes while ranking
+            if isinstance(command, commands.EndTurn):
+                continue
+            self.engine.make(command)
+            ranked.append([self.evaluate(), command])
+            self.engine.unmake()
+        ranked.sort(key=lambda result: result[0], reverse=True)
+        return ranked
+
+    def evaluate(self):
+        """ how good the game is for the player, their strength less that of the players still in the game """
+        self.evaluations += 1
+        value = self.get_strength(self.player)
+        for player in self.model.players:
+            if player is not self.player:
+                value -= self.get_strength(player)
+
+        distances = self.get_distances()
+        for unit in self.player.units:
+            distance = distances.get(tuple(unit.position))
+            if distance == 0:
+                value += READY_VALUE
+            elif distance is not None:
+                value -= distance * DISTANCE_VALUE
+        return value
+
+    def get_strength(self, player):
+        strength = player.get_ap()
+        for city_position in player.settlements:
+            city = self.model.world.get_tile(city_position)
+            strength += CITY_VALUE + city.get_level() * LEVEL_VALUE + city.sub_level * SUB_LEVEL_VALUE
+
+        for unit in player.units:
+            strength += UNIT_VALUE * constants.UNIT_SPECS[unit.type]["spawn_cost"] * unit.health / unit.max_health
+        return strength
+
+    def get_distances(self):
+        """ steps from each tile units can cross to the nearest city the player doesn't hold """
+        targets = tuple(tuple(city.get_position()) for city in self.cities
+                        if city.get_holder() != self.player.get_name())
+        if targets not in self.distances:
+            self.distances[targets] = get_distances(self.model.world, targets)
+        return self.distances[targets]
+
+
+def get_distances(world, targets):
+    """ breadth first search out from targets, over tiles every unit type can move on """
+    passable = set.intersection(*[set(specs["moves"]) for specs in constants.UNIT_SPECS.values()])
+    distances = {target: 0 for target in targets}
+    frontier = list(targets)
+    while frontier:
+        next_frontier = []
+        for row, col in frontier:
+            for x in model.get_range(row, 1, constants.MAP_SIZE[0]):
+                for y in model.get_range(col, 1, constants.MAP_SIZE[1]):
+                    if (x, y) not in distances and world.tiles[x][y].get_type() in passable:
+                        distances[(x, y)] = distances[(row, col)] + 1
+                        next_frontier.append((x, y))
+        frontier = next_frontier
+    return distances
@@ -0,0 +1,34 @@
+# Typed game actions, used to drive the model without the GUI. Positions are [row, col].
+
+from collections import namedtuple
+
+Spawn = namedtuple("Spawn", ["unit_type", "position"])  # position of the current player's city
+Move = namedtuple("Move", ["unit_position", "position"])
+Attack = namedtuple("Attack", ["unit_position", "target_position"])
+Conquer = namedtuple("Conquer", ["position"])  # position of the unit, and the city it is in
+Upgrade = namedtuple("Upgrade", ["position"])  # buys the next sub-level of the city
+EndTurn = namedtuple("EndTurn", [])
+
+COMMAND_NAMES = {
+    Spawn: "spawn",
+    Move: "move",
+    Attack: "attack",
+    Conquer: "conquer",
+    Upgrade: "upgrade",
+    EndTurn: "end_turn",
+}
+COMMAND_TYPES = {name: command_type for command_type, name in COMMAND_NAMES.items()}
+
+
+def to_data(command):
+    """ command as a json friendly list, ie: ["move", [2, 3], [3, 3]] """
+    return [COMMAND_NAMES[type(command)]] + [list(value) if isinstance(value, tuple) else value for value in command]
+
+
+def from_data(command_data):
+    """ raises KeyError, IndexError, TypeError or ValueError if command_data isn't a command, ie a bad line """
+    command = COMMAND_TYPES[command_data[0]](*command_data[1:])
+    for field, value in zip(command._fields, command):
+        if field != "unit_type" and not (isinstance(value, (list, tuple)) and len(value) == 2):
+            raise ValueError("Not A Position: %s" % (value,))
+    return command
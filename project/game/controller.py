@@ -1,10 +1,15 @@
 import pygame
 
-import project.game.model as model
+import project.game.engine as engine
 import project.game.gui as gui
+import project.game.journal as journal
+import project.game.delta as delta
 import project.menus.leaderboard as leaderboard
-import project.data as data
+import project.game.savefile as savefile
+import project.game.saveindex as saveindex
+import project.game.thumbnail as thumbnail
 import paths
+import constants
 
 
 class Controller:
@@ -15,8 +20,12 @@ class Controller:
         self.game_reference = game_reference
 
         # Game Model Setup
-        save_data = data.load(paths.gamePath + self.game_reference)
-        self.game_model = model.Model(save_data)
+        self.game_model = engine.load(self.game_reference).get_model()  # last full save, plus delta saves since
+        self.game_model.record_journal()
+        self.journal = journal.Journal(self.game_reference)
+        if not self.journal.keyframes:  # journal starts here, ie games from before journals were kept
+            self.journal.write([], self.game_model)
+        self.deltas = len(delta.load(self.game_reference, self.game_model.get_saves()))  # since the last full save
 
         # View + GUI Setup
         self.GUI = gui.GameGui(self, self.display, self.game_model)
@@ -28,18 +37,33 @@ class Controller:
             return self.state  # focus ends, back to main program controller to deal with new state
         else:
             # game has been won
+            self.save()  # so the journal ends with the winning commands, it is kept to replay the game
             leaderboard_editor = leaderboard.LeaderboardEditor()
             for player in self.game_model.players:
                 leaderboard_editor.add_player(player.get_name(), player.max_score)
 
-            data.delete(paths.gamePath + self.game_reference)
+            savefile.delete(paths.gamePath + self.game_reference)
+            delta.delete(self.game_reference)
+            saveindex.remove(self.game_reference)
+            thumbnail.delete(self.game_reference)
             return "menu"
 
     def quit(self):
-        self.save()
+        self.save(compact=True)  # so the game loads without any deltas next time
 
-    def save(self):
-        data.save(self.game_model.get_save_data(), paths.gamePath + self.game_reference)
+    def save(self, compact=False):
+        """ appends what changed since the last save, compacting into one full save every so often """
+        command_list = self.game_model.take_journal()
+        if compact or self.deltas >= constants.SAVE_COMPACT_INTERVAL:
+            delta.compact(self.game_model, self.game_reference)
+            self.deltas = 0
+        else:
+            delta.append(self.game_reference, command_list, self.game_model)
+            saveindex.update(self.game_reference, self.game_model.get_save_data())
+            self.deltas += 1
+        self.journal.write(command_list, self.game_model)
+        if self.deltas == 0:  # full saves only, so not each turn. Older thumbnails are made again when listed
+            thumbnail.save(self.game_model, self.game_reference)  # after the index, so it is newer than the save
 
     def get_state(self):
         return self.state
@@ -0,0 +1,59 @@
+# Delta saves, which append what changed since the last save instead of rewriting the whole game.
+# A save is then the last full save, plus the commands and player settings of each delta after it.
+# Each delta notes which full save it follows (Model.saves), as writes can be joined and reordered by the save writer.
+
+import json
+import os
+
+import paths
+import project.data as data
+import project.game.commands as commands
+import project.game.savefile as savefile
+import project.game.saveindex as saveindex
+
+
+def get_path(game_reference):
+    return paths.gamePath + game_reference + ".delta"
+
+
+def delete(game_reference):
+    data.remove(get_path(game_reference))
+
+
+def compact(game_model, game_reference):
+    """ writes a full save of the game, replacing its delta saves """
+    game_model.saves += 1  # first, so if the deltas outlive the save (ie killed writing) they are never applied to it
+    os.makedirs(paths.gamePath, exist_ok=True)  # not made until a game is first saved
+    savefile.save(game_model.get_save_data(), paths.gamePath + game_reference)
+    delete(game_reference)
+    saveindex.update(game_reference, game_model.get_save_data())
+
+
+def load(game_reference, saves):
+    """ the delta records following on from full save number saves, oldest first """
+    data.flush()
+    return read(game_reference, saves)
+
+
+def read(game_reference, saves):
+    """ as load, without waiting on the save writer, see project.game.savefile.read """
+    if not os.path.isfile(get_path(game_reference)):
+        return []
+    with open(get_path(game_reference), "r") as file:
+        records = [json.loads(line) for line in file if line.endswith("\n")]  # last line is cut off if killed writing
+    return [record for record in records if record.get("base", 0) == saves]
+
+
+def append(game_reference, command_list, game_model):
+    """ command_list are the commands made since the last save. Player settings aren't commands, so are kept too """
+    record = {
+        "base": game_model.get_saves(),
+        "commands": [commands.to_data(command) for command in command_list],
+        "players": [{
+            "name": player.get_name(),
+            "camera_focus": player.get_camera_focus(),
+            "show_minimap": player.get_minimap_status(),
+            "max_score": player.get_max_score(),
+        } for player in game_model.players],
+    }
+    data.append(json.dumps(record) + "\n", get_path(game_reference))
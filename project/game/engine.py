@@ -0,0 +1,237 @@
+# Headless game engine, applies commands straight to the model. Must not import pygame, so it can run without a display.
+
+import constants
+import paths
+import project.game.savefile as savefile
+import project.game.model as model
+import project.game.new as new
+import project.game.commands as commands
+import project.game.delta as delta
+
+
+def load(game_name):
+    """ loads the last full save, then applies each delta save made since """
+    game_engine = Engine(model.Model(savefile.load(paths.gamePath + game_name)))
+    for record in delta.load(game_name, game_engine.get_model().get_saves()):
+        game_engine.apply_delta(record)
+    return game_engine
+
+
+def read(game_name):
+    """ as load, but never waits on or takes errors from the save writer, so can be used off the main thread """
+    game_engine = Engine(model.Model(savefile.read(paths.gamePath + game_name)))
+    for record in delta.read(game_name, game_engine.get_model().get_saves()):
+        game_engine.apply_delta(record)
+    return game_engine
+
+
+def make(map_name, players, game_name="headless", seed=None):
+    """ players is a list of {"name": name, "colour": colour}, as for project.game.new.make """
+    return Engine(model.Model(new.get_game_data(game_name, map_name, players, seed)))
+
+
+class Engine:
+    """ plays a game through commands, checking each is legal for the current player as the GUI would """
+    def __init__(self, game_model):
+        self.model = game_model
+        self.history = []  # undo functions of commands applied with make(), most recent last
+
+    def get_model(self):
+        return self.model
+
+    def get_save_data(self):
+        return self.model.get_save_data()
+
+    def run(self, command_stream):
+        """ applies commands until the stream ends or the game is won, returns the number applied """
+        applied = 0
+        for command in command_stream:
+            if self.model.game_ended():
+                break
+            if self.apply(command):
+                applied += 1
+        return applied
+
+    def apply(self, command):
+        """ returns True if the command was legal, and so applied """
+        return self.perform(command) is not None
+
+    def apply_delta(self, record):
+        """ applies a record from project.game.delta, which must follow on from the game as it is """
+        for command_data in record["commands"]:
+            command = commands.from_data(command_data)
+            if not self.apply(command):
+                raise ValueError("Delta Save Command Can't Be Applied: %s" % (command,))
+
+        for player_data in record["players"]:
+            player = self.model.get_player(player_data["name"])
+            player.set_camera_focus(player_data["camera_focus"])
+            player.set_minimap_status(player_data["show_minimap"])
+            player.max_score = player_data["max_score"]
+
+    def make(self, command):
+        """ as apply, but the command can be taken back with unmake(), ie for searching ahead """
+        undo = self.perform(command)
+        if undo is None:
+            return False
+        self.history.append(undo)
+        return True
+
+    def unmake(self):
+        """ restores the model to before the last make(). Only what commands change is restored, so cost is
+        independent of world size. (Player max scores are only updated by Player.get_score, so aren't restored.) """
+        if not self.history:
+            return False
+        self.history.pop()()
+        self.model.revision += 1  # the model has changed again, revision is never wound back
+        return True
+
+    def perform(self, command):
+        """ applies command if legal, returning a function that undoes it, or None if it was not legal """
+        if self.model.game_ended():
+            return None
+
+        if isinstance(command, commands.Spawn):
+            return self.spawn(command.unit_type, list(command.position))
+        elif isinstance(command, commands.Move):
+            return self.move(list(command.unit_position), list(command.position))
+        elif isinstance(command, commands.Attack):
+            return self.attack(list(command.unit_position), list(command.target_position))
+        elif isinstance(command, commands.Conquer):
+            return self.conquer(list(command.position))
+        elif isinstance(command, commands.Upgrade):
+            return self.upgrade(list(command.position))
+        elif isinstance(command, commands.EndTurn):
+            return self.end_turn()
+        raise TypeError("Invalid Command: %s" % (command,))
+
+    def get_own_unit(self, position):
+        unit = self.model.get_unit(position)
+        if unit is not None and unit.owner == self.model.current_player_name:
+            return unit
+        return None
+
+    def spawn(self, unit_type, position):
+        if unit_type not in constants.UNIT_SPECS:
+            return None
+        if not in_map(position) or not self.model.settlement_selected(position):
+            return None
+
+        player = self.model.get_current_player()
+        ap = player.get_ap()
+        if not self.model.try_spawn(unit_type, position):
+            return None
+
+        def undo():
+            self.model.vacate(player.units.pop())  # new unit is always last
+            player.ap = ap
+        return undo
+
+    def move(self, unit_position, position):
+        unit = self.get_own_unit(unit_position)
+        if unit is None or position not in self.model.get_moves(unit):
+            return None
+
+        moved = unit.has_moved()
+        self.model.move_unit(position, unit)
+
+        def undo():
+            self.model.vacate(unit)
+            unit.position = unit_position
+            unit.moved = moved
+            self.model.occupy(unit)
+        return undo
+
+    def attack(self, unit_position, target_position):
+        attacker = self.get_own_unit(unit_position)
+        if attacker is None or target_position not in self.model.get_attacks(attacker):
+            return None
+        defender = self.model.get_unit(target_position)
+
+        # units are put back where they were in their owners list if killed, so order of play is unchanged.
+        previous = [[unit, unit.health, self.model.get_player(unit.owner).units.index(unit)]
+                    for unit in [attacker, defender]]
+        attacked = attacker.has_attacked()
+        self.model.make_attack(attacker, defender)
+
+        def undo():
+            for unit, health, index in previous:
+                if unit.health <= 0:  # was killed
+                    self.model.get_player(unit.owner).units.insert(index, unit)
+                    self.model.occupy(unit)
+                unit.health = health
+            attacker.attacked = attacked
+        return undo
+
+    def conquer(self, position):
+        unit = self.get_own_unit(position)
+        if unit is None or not self.model.check_conquer(unit):
+            return None
+
+        city = self.model.world.get_tile(position)
+        player = self.model.get_current_player()
+        previous_holder = self.model.get_player(city.get_holder())
+        holder_index = None
+        holder_units = None
+        if previous_holder is not None:
+            holder_index = previous_holder.settlements.index(city.get_position())
+            if len(previous_holder.settlements) == 1:  # will be destroyed, which clears their units
+                holder_units = list(previous_holder.units)
+        unit_state = [unit.moved, unit.attacked]
+        game_end = self.model.game_end
+
+        self.model.conquer(position)
+        self.model.handle_death()  # might have taken the last city of a player
+
+        def undo():
+            if holder_units is not None:
+                previous_holder.dead = False
+                previous_holder.units.extend(holder_units)
+                for holder_unit in holder_units:
+                    self.model.occupy(holder_unit)
+            player.settlements.pop()  # conquered city is always last
+            if previous_holder is not None:
+                previous_holder.settlements.insert(holder_index, city.get_position())
+                city.change_holder(previous_holder.get_name())
+            else:
+                city.change_holder(None)
+            unit.moved, unit.attacked = unit_state
+            self.model.game_end = game_end
+        return undo
+
+    def upgrade(self, position):
+        if not in_map(position) or not self.model.settlement_selected(position):
+            return None
+        city = self.model.world.get_tile(position)
+        if city.at_max() or not city.afford_upgrade():
+            return None
+
+        player = self.model.get_current_player()
+        previous = [city.level, city.sub_level, player.get_ap()]
+        city.add_sub_level()
+
+        def undo():
+            city.level, city.sub_level, player.ap = previous
+        return undo
+
+    def end_turn(self):
+        player = self.model.get_current_player()
+        if self.model.is_winner():
+            next_player = player  # game ends, current player starts turn again
+        else:
+            next_player = self.model.get_player(self.model.get_next_player())
+        previous = [self.model.current_player_name, player.turn, next_player.ap, self.model.game_end]
+        unit_states = [[unit, unit.moved, unit.attacked] for unit in next_player.units]  # all reset by start_turn
+
+        self.model.next_turn()
+
+        def undo():
+            for unit, moved, attacked in unit_states:
+                unit.moved = moved
+                unit.attacked = attacked
+            self.model.current_player_name, player.turn, next_player.ap, self.model.game_end = previous
+        return undo
+
+
+def in_map(position):
+    return 0 <= position[0] < constants.MAP_SIZE[0] and 0 <= position[1] < constants.MAP_SIZE[1]
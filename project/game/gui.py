@@ -5,6 +5,11 @@ import paths
 import constants
 
 import pygame_gui
+import project.scheduler as scheduler
+import project.game.ai as ai
+import project.game.engine as engine
+import project.game.commands as commands
+import project.game.isometric as isometric
 import project.game.scroll as scroll
 import project.game.view as view
 
@@ -16,11 +21,14 @@ class GameGui:
         self.display = display
         self.model_link = model
         self.state = "game"
+        self.frames = scheduler.FrameScheduler()
+        self.engine = engine.Engine(self.model_link)  # checks and makes computer players' commands
+        self.computer_player = None  # ai.TurnWorker planning the current computer player's turn
 
         # Game View Setup
         self.game_view = view.PhysicalGame(self.display, self.model_link, self)
         self.camera = scroll.Camera(self.display, self.game_view.game_surface, 25, 6)
-        self.mini_map = MiniMap(self.model_link)
+        self.mini_map = MiniMap(self.model_link, self.camera)
 
         # GUI Setup
         # Fixed GUI
@@ -59,21 +67,28 @@ class GameGui:
             self.launch_welcome_message()
 
     def run(self):
+        scrolling = False
         while self.state == "game":
+            # only the camera and computer players' progress moves without input
+            events = self.frames.get_events(idle=not scrolling and self.computer_player is None)
 
             if self.model_link.game_ended():
                 # game ended at deletion of game over message (called in GameOverMessage on its "ok")
                 if GameOverMessage not in [type(obj) for obj in self.persistent_guis]:  # stops recalling when active
                     self.game_over_message()
 
+            elif self.model_link.get_current_player().is_ai():
+                self.update_computer_turn()
+
             mouse_x, mouse_y = pygame.mouse.get_pos()
 
             # Camera Scroll
+            scrolling = False
             if not self.persistent_guis and not self.passive_guis and pygame.mouse.get_focused():
-                self.camera.handle_scroll(mouse_x, mouse_y, self.get_rects())
+                scrolling = self.camera.handle_scroll(mouse_x, mouse_y, self.get_rects())
 
             # Main Event Handling
-            for event in pygame.event.get():
+            for event in events:
                 if event.type == pygame.QUIT:
                     if QuitMessage not in [type(obj) for obj in self.persistent_guis]:  # stops recalling when active
                         self.quit_message()
@@ -97,6 +112,7 @@ class GameGui:
             # Drawing
             self.draw()
             pygame.display.update()
+            self.frames.tick()
 
         # Here has been game quit, returns to controller call, where save and new state are processed.
         return self.state
@@ -104,7 +120,7 @@ class GameGui:
     def handle_click(self, mouse_x, mouse_y):
         if not self.handled_persistent_gui(mouse_x, mouse_y):
             if not self.handled_passive_gui(mouse_x, mouse_y):
-                if not self.handled_fixed_gui(mouse_x, mouse_y):
+                if not self.handled_fixed_gui(mouse_x, mouse_y) and not self.model_link.get_current_player().is_ai():
                     if self.game_view.map_clicked(mouse_x, mouse_y):  # update tile focus, reset active_unit if off map
                         if self.game_view.active_unit is not None:
                             self.game_view.handle_unit_actions()  # if action, reset active_unit
@@ -150,7 +166,8 @@ class GameGui:
         elif self.leaderboard_button.check_clicked():
             self.launch_leaderboard()
         elif self.next_turn_button.check_clicked():
-            self.next_turn_message()  # next_turn action triggered at closing of GUI message, in the GUI.
+            if not self.model_link.get_current_player().is_ai():  # computer players end their own turns
+                self.next_turn_message()  # next_turn action triggered at closing of GUI message, in the GUI.
         else:
             self.mini_map.handle_click()
 
@@ -169,11 +186,43 @@ class GameGui:
     def launch_welcome_message(self):
         self.persistent_guis.append(WelcomeMessage(self))
 
+    def update_computer_turn(self):
+        """ plans a computer player's turn in the background, then makes it once any messages are closed """
+        if self.computer_player is None:
+            self.passive_guis.clear()  # menus belong to the last person to play
+            self.game_view.reset_focus()
+            self.computer_player = ai.TurnWorker(self.model_link)
+
+        elif self.computer_player.is_done() and not self.persistent_guis:
+            plan = self.computer_player.get_plan()
+            self.computer_player = None
+            for command in plan:
+                if isinstance(command, commands.EndTurn):
+                    self.next_turn()
+                    if not self.model_link.get_current_player().is_ai():  # handed over, as after a person's turn
+                        self.persistent_guis.append(Message(self, "Next Turn", self.get_ready_text()))
+                else:
+                    self.game_view.apply_command(command)
+            self.player_tracker.update_player()
+
+        if self.computer_player is not None:
+            self.player_tracker.set_progress(self.computer_player.get_progress())
+        else:
+            self.player_tracker.set_progress(None)
+
     def next_turn_message(self):
         next_player = self.model_link.get_player(self.model_link.get_next_player())
-        self.persistent_guis.append(NextTurnMessage(self, "Next Turn",
-                                                    ["Get ready %s!" % next_player.get_name(),
-                                                     "It's your turn up next."]))
+        if next_player.is_ai():
+            self.next_turn()  # no one needs to get ready
+            return
+
+        self.persistent_guis.append(NextTurnMessage(self, "Next Turn", self.get_ready_text(next_player)))
+
+    def get_ready_text(self, player=None):
+        """ tells player (default the current player) it's their turn, so players sharing a computer swap over """
+        if player is None:
+            player = self.model_link.get_current_player()
+        return ["Get ready %s!" % player.get_name(), "It's your turn up next."]
 
     def game_over_message(self):
         self.persistent_guis.clear()  # To remove conquer message caused by taking last settlement
@@ -747,6 +796,8 @@ class PlayerTracker:
     """ displays current player infomation in top panel"""
     def __init__(self, model):
         self.model_link = model
+        self.revision = None  # model revision last shown
+        self.progress = None  # how far through planning its turn a computer player is, 0 to 1
 
         # GUI Setup
         self.current_player_name_text = pygame_gui.Text(
@@ -784,6 +835,10 @@ class PlayerTracker:
             self.player_values_panel.rect[0] + 180, 2)
 
     def update_player(self):
+        if self.revision == self.model_link.get_revision():
+            return  # nothing has changed since last update
+        self.revision = self.model_link.get_revision()
+
         current_player = self.model_link.get_current_player()
         self.current_player_name_text.change_text(current_player.get_name() + "'s turn")
         self.topleft_panel.reset_width(self.name_padding + self.current_player_name_text.get_rect()[2])
@@ -792,6 +847,9 @@ class PlayerTracker:
         self.update_player_score(current_player)
         self.update_player_ap(current_player)
 
+    def set_progress(self, progress):
+        self.progress = progress
+
     def update_player_score(self, player):
         self.current_score_text.change_text("{:,}".format(player.get_score()))
 
@@ -803,6 +861,9 @@ class PlayerTracker:
         self.topleft_panel.draw(display)
         pygame.draw.circle(display, constants.COLOURS[self.model_link.get_current_player().get_colour()], [10, 12], 7)
         self.current_player_name_text.draw(display)
+        if self.progress is not None:  # thin bar under the name
+            pygame.draw.rect(display, constants.COLOURS[self.model_link.get_current_player().get_colour()],
+                             [0, self.topleft_panel.rect.bottom, self.topleft_panel.rect.width * self.progress, 3])
 
         self.player_values_panel.draw(display)
 
@@ -880,69 +941,47 @@ class PlayerTracker:
 #             self.metal_text.draw(display)
 
 
-class MiniMapTile:
-    def __init__(self, rect, colour):
-        self.background = pygame_gui.Panel(rect, 200, colour)
-
-    def update_colour(self, colour):
-        self.background.colour = colour
-
-    def draw(self, display):
-        self.background.draw(display)
-
-
-class MiniMapCircle(MiniMapTile):
-    def draw(self, display):
-        pygame.draw.ellipse(display, self.background.colour, self.background.rect)
+def get_minimap_colour(tile, model):
+    if tile.get_type() == "w":
+        return 0, 100, 255
+    elif tile.get_type() == "g":
+        return 0, 200, 0
+    elif tile.get_type() == "f":
+        return 0, 100, 0
+    elif tile.get_type() == "m":
+        return 100, 100, 100
+    elif tile.get_type() == "o":
+        return 60, 60, 60
+    elif tile.get_type() == "c":
+        if tile.get_holder() is not None:
+            return constants.COLOURS[model.get_player(tile.get_holder()).get_colour()]
+        return 200, 200, 200
+    return None  # sea is left as background
 
 
 class MiniMap:
-    def __init__(self, model):
+    """ map overview, pre-rendered to one surface and patched per tile as cities change hands """
+    def __init__(self, model, camera):
         self.model_link = model
+        self.camera = camera
 
         # Map Setup
-        self.tiles = []
         self.tile_size = 6
         self.border = self.tile_size
         self.padding = 1  # between each squares
+        self.transparency = 200  # of both the background and the tiles drawn over it
         self.panel_size = [self.tile_size*constants.MAP_SIZE[0] + self.padding*constants.MAP_SIZE[0] + self.border*2,
                            self.tile_size*constants.MAP_SIZE[1] + self.padding*constants.MAP_SIZE[1] + self.border*2]
         self.panel_position = [0, constants.DISPLAY_SIZE[1] - self.panel_size[1]]
 
         self.background = pygame_gui.Panel(
             [self.panel_position[0], self.panel_position[1], self.panel_size[0], self.panel_size[1]],
-            200,
+            self.transparency,
             constants.COLOURS["panel"])
-        self.tiles = []
-        x = self.panel_position[0] + self.border
-        y = self.panel_position[1] + self.border
-        for row in self.model_link.world.tiles:
-            for tile in row:
-                if tile.type == "s":
-                    pass
-                elif tile.type == "w":
-                    self.tiles.append(MiniMapTile([x, y, self.tile_size, self.tile_size], (0, 100, 255)))
-                elif tile.type == "g":
-                    self.tiles.append(MiniMapTile([x, y, self.tile_size, self.tile_size], (0, 200, 0)))
-                elif tile.type == "f":
-                    self.tiles.append(MiniMapTile([x, y, self.tile_size, self.tile_size], (0, 100, 0)))
-                elif tile.type == "m":
-                    self.tiles.append(MiniMapTile([x, y, self.tile_size, self.tile_size], (100, 100, 100)))
-                elif tile.type == "o":
-                    self.tiles.append(MiniMapTile([x, y, self.tile_size, self.tile_size], (60, 60, 60)))
-                elif tile.type == "c":
-                    rect = [x + self.padding, y + self.padding,
-                            self.tile_size - self.padding*2, self.tile_size - self.padding*2]
-                    if tile.current_holder is not None:
-                        player = self.model_link.get_player(tile.current_holder)
-                        colour = player.get_colour()
-                        self.tiles.append(MiniMapTile(rect, constants.COLOURS[colour]))
-                    else:
-                        self.tiles.append(MiniMapTile(rect, (200, 200, 200)))
-
-                y += self.tile_size + self.padding
-            y = self.panel_position[1] + self.border
-            x += self.tile_size + self.padding
+        self.surface = pygame.Surface(self.panel_size, pygame.SRCALPHA)
+        self.city_holders = {}  # {city position: holder it was last drawn with}
+        self.revision = None  # model revision the cities were last drawn at
+        self.refresh()
 
         # GUI Interaction
         self.hide_button = pygame_gui.TextButton(
@@ -956,7 +995,61 @@ class MiniMap:
             "show minimap", constants.FONTS["sizes"]["medium"], constants.FONTS["colour"], constants.FONTS["main"])
 
     def refresh(self):
-        self.__init__(self.model_link)
+        self.surface.fill(self.get_background_colour())
+        for row in self.model_link.world.tiles:
+            for tile in row:
+                self.update_tile(tile.get_position())
+                if tile.get_type() == "c":
+                    self.city_holders[tuple(tile.get_position())] = tile.get_holder()
+        self.revision = self.model_link.get_revision()
+
+    def update_cities(self):  # only cities change colour during a game, and only those changing hands are drawn
+        for position, holder in self.city_holders.items():
+            city = self.model_link.world.get_tile(position)
+            if city.get_holder() != holder:
+                self.update_tile(position)
+                self.city_holders[position] = city.get_holder()
+        self.revision = self.model_link.get_revision()
+
+    def get_background_colour(self):
+        return constants.COLOURS["panel"] + (self.transparency,)
+
+    def get_tile_colour(self, colour):
+        # colour is drawn over the background in one surface, so blend them to look as if drawn one after the other.
+        alpha = self.transparency / 255
+        combined_alpha = 1 - (1 - alpha) ** 2
+        return tuple(round(value * alpha / combined_alpha) for value in colour) + (round(combined_alpha * 255),)
+
+    def get_tile_rect(self, position):  # relative to the minimap, rows run left to right
+        return pygame.Rect(self.border + position[0] * (self.tile_size + self.padding),
+                           self.border + position[1] * (self.tile_size + self.padding),
+                           self.tile_size, self.tile_size)
+
+    def update_tile(self, position):
+        tile = self.model_link.world.get_tile(position)
+        rect = self.get_tile_rect(position)
+        colour = get_minimap_colour(tile, self.model_link)
+
+        self.surface.fill(self.get_background_colour(), rect)
+        if colour is not None:
+            if tile.get_type() == "c":  # cities drawn smaller, to stand out
+                rect.inflate_ip(-self.padding*2, -self.padding*2)
+            self.surface.fill(self.get_tile_colour(colour), rect)
+
+    def draw_view(self, display):
+        """ outlines the part of the map seen on screen, a diamond as the map is isometric """
+        corners = [[0, 0], [display.get_width(), 0],
+                   [display.get_width(), display.get_height()], [0, display.get_height()]]
+        points = []
+        for corner in corners:
+            index = isometric.getIndex(corner, self.camera.get_position())
+            points.append([self.panel_position[0] + self.border + index[0] * (self.tile_size + self.padding),
+                           self.panel_position[1] + self.border + index[1] * (self.tile_size + self.padding)])
+
+        previous_clip = display.get_clip()
+        display.set_clip(self.background.rect)
+        pygame.draw.polygon(display, constants.COLOURS["white"], points, 1)
+        display.set_clip(previous_clip)
 
     def is_visible(self):
         return self.model_link.get_current_player().get_minimap_status()
@@ -973,10 +1066,10 @@ class MiniMap:
         if self.is_visible():
             self.hide_button.draw(display)
 
-            self.background.draw(display)
-
-            for tile in self.tiles:
-                tile.draw(display)
+            if self.revision != self.model_link.get_revision():
+                self.update_cities()
+            display.blit(self.surface, self.panel_position)
+            self.draw_view(display)
 
         else:
             self.show_button.draw(display)
@@ -0,0 +1,79 @@
+# Append-only record of every command made in a game, kept next to its save so the game can be replayed.
+# Keyframes are full snapshots taken every so many commands, so replays can seek without replaying from the start.
+
+import json
+import os
+import shutil
+
+import constants
+import paths
+import project.data as data
+import project.game.commands as commands
+import project.game.savefile as savefile
+
+
+def get_path(game_reference):
+    return paths.gamePath + game_reference + ".journal"
+
+
+def get_keyframe_path(game_reference):
+    return paths.gamePath + game_reference + "-keyframes" + os.sep
+
+
+def exists(game_reference):
+    return data.check_exists(get_path(game_reference))
+
+
+def can_replay(game_reference):
+    """ True once the game has been opened, as the first keyframe is taken then, before any command is journaled """
+    return bool(get_keyframes(game_reference))
+
+
+def delete(game_reference):
+    data.flush()  # keyframes might still be being written
+    if os.path.isfile(get_path(game_reference)):
+        os.remove(get_path(game_reference))
+    shutil.rmtree(get_keyframe_path(game_reference), ignore_errors=True)
+
+
+def load_commands(game_reference):
+    if not exists(game_reference):
+        return []
+    with open(get_path(game_reference), "r") as file:  # last line is cut off if killed while writing
+        return [commands.from_data(json.loads(line)) for line in file if line.endswith("\n")]
+
+
+def get_keyframes(game_reference):
+    """ sorted positions of the keyframes, each the number of commands made before it was taken """
+    data.flush()
+    if not os.path.isdir(get_keyframe_path(game_reference)):
+        return []
+    return sorted(int(remove_file_extension(filename)) for filename in os.listdir(get_keyframe_path(game_reference)))
+
+
+def load_keyframe(game_reference, position):
+    return savefile.load(get_keyframe_path(game_reference) + str(position))
+
+
+def remove_file_extension(filename):
+    return filename.split(".")[0]
+
+
+class Journal:
+    """ writes a game's commands as they are saved, taking a keyframe each constants.KEYFRAME_INTERVAL commands """
+    def __init__(self, game_reference):
+        self.game_reference = game_reference
+        self.length = len(load_commands(game_reference))
+        self.keyframes = get_keyframes(game_reference)
+
+    def write(self, command_list, game_model):
+        """ command_list are the commands made since the last write, game_model the game after them """
+        if command_list:
+            data.append("".join(json.dumps(commands.to_data(command)) + "\n" for command in command_list),
+                        get_path(self.game_reference))
+            self.length += len(command_list)
+
+        if not self.keyframes or self.length - self.keyframes[-1] >= constants.KEYFRAME_INTERVAL:
+            os.makedirs(get_keyframe_path(self.game_reference), exist_ok=True)
+            savefile.save(game_model.get_save_data(), get_keyframe_path(self.game_reference) + str(self.length))
+            self.keyframes.append(self.length)
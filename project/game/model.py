@@ -3,6 +3,7 @@ import paths
 import constants
 
 import project.game.calculations as calculations
+import project.game.commands as commands
 
 
 class Model:
@@ -11,11 +12,20 @@ class Model:
         self.game_name = save_data["game_name"]
         self.map_name = save_data["map_name"]
         self.game_end = save_data["game_end"]
+        self.seed = save_data.get("seed")  # games saved before seeding have none
+        self.saves = save_data.get("saves", 0)  # full saves made, delta saves note which they follow on from
+        self.revision = 0  # bumped by every change to the game, so views can tell when to recompute
+        self.journal = None  # commands made since last taken, None when they aren't being recorded
 
         self.players = [Player(self, player_data) for player_data in save_data["players"]]
 
         self.world = World(self, save_data["world"])  # assigns settlements to players
 
+        # Occupancy grid of (row, col) -> unit, kept in step with every unit change so lookups don't scan all units.
+        self.occupancy = {}
+        for unit in self.all_units():
+            self.occupy(unit)
+
         # If the game is new set the current player, else just load it in.
         if save_data["current_player"] is None:
             self.current_player_name = self.players[0].get_name()
@@ -28,6 +38,8 @@ class Model:
             "game_name": self.game_name,
             "map_name": self.map_name,
             "game_end": self.game_end,
+            "seed": self.seed,
+            "saves": self.saves,
             "current_player": self.current_player_name,  # store name, player data is stored in "players"
             "players": [player.get_save_data() for player in self.players],
             "world": self.world.get_save_data()
@@ -42,7 +54,37 @@ class Model:
     def all_units(self):
         return [unit for player in self.players for unit in player.units]
 
+    def get_seed(self):
+        return self.seed
+
+    def get_saves(self):
+        return self.saves
+
+    def get_revision(self):
+        return self.revision
+
+    def record_journal(self):
+        self.journal = []
+
+    def record(self, command):
+        if self.journal is not None:
+            self.journal.append(command)
+
+    def take_journal(self):
+        """ returns the commands made since last taken """
+        command_list = self.journal
+        self.journal = []
+        return command_list
+
+    def occupy(self, unit):
+        self.occupancy[tuple(unit.position)] = unit
+
+    def vacate(self, unit):
+        del self.occupancy[tuple(unit.position)]
+
     def next_turn(self):
+        self.revision += 1
+        self.record(commands.EndTurn())
         self.get_current_player().end_turn()
 
         # Getting new turn
@@ -68,16 +110,20 @@ class Model:
         if not self.get_unit(position):
             current_player = self.get_current_player()
             if current_player.get_ap() - constants.UNIT_SPECS[unit_type]["spawn_cost"] >= 0:
+                self.revision += 1
+                self.record(commands.Spawn(unit_type, list(position)))
                 current_player.add_unit(Unit(unit_type, position, current_player.get_name()))
                 current_player.take_ap(constants.UNIT_SPECS[unit_type]["spawn_cost"])
                 return True
         return False
 
     def make_attack(self, attacker, defender):
+        self.revision += 1
+        self.record(commands.Attack(list(attacker.position), list(defender.position)))
         attacker.set_attacked()
         killed_units = calculations.apply_attack(attacker, defender)
         for unit in killed_units:  # could be both units
-            self.get_player(unit.owner).units.remove(unit)
+            self.get_player(unit.owner).delete_unit(unit)
 
     def check_conquer(self, unit):
         if (self.world.get_tile(unit.position).get_type() == "c" and
@@ -87,7 +133,10 @@ class Model:
         return False
 
     def conquer(self, position):
+        self.revision += 1
+        self.record(commands.Conquer(list(position)))
         settlement = self.world.get_tile(position)
+        self.get_unit(position).make_inactive()  # conquering unit has used its turn
 
         if settlement.current_holder is not None:
             self.get_player(settlement.current_holder).remove_settlement(settlement.get_position())
@@ -98,6 +147,7 @@ class Model:
     def handle_death(self):
         for player in self.players:
             if self.check_death(player):
+                self.revision += 1
                 player.kill()
 
                 if self.is_winner():  # here, as otherwise must wait for next_turn call
@@ -122,16 +172,10 @@ class Model:
         return self.get_player(self.current_player_name)
 
     def unit_selected(self, position):
-        for unit in self.all_units():
-            if position == unit.position:
-                return True
-        return False
+        return tuple(position) in self.occupancy
 
     def get_unit(self, position):
-        for unit in self.all_units():
-            if unit.position == position:
-                return unit
-        return None
+        return self.occupancy.get(tuple(position))
 
     def settlement_selected(self, position):
         tile = self.world.get_tile(position)
@@ -142,29 +186,62 @@ class Model:
     def get_moves(self, unit):
         moves = []
         if not unit.has_moved():
-            for x in range(unit.position[0] - unit.movement, unit.position[0] + unit.movement + 1):
-                for y in range(unit.position[1] - unit.movement, unit.position[1] + unit.movement + 1):
-                    if ([x, y] != unit.position and
-                            x in range(0, constants.MAP_SIZE[0]) and
-                            y in range(0, constants.MAP_SIZE[1]) and
-                            self.world.get_tile([x, y]).get_type() in unit.allowed_moves and not self.get_unit([x, y])):
+            for x in get_range(unit.position[0], unit.movement, constants.MAP_SIZE[0]):
+                for y in get_range(unit.position[1], unit.movement, constants.MAP_SIZE[1]):
+                    # units own position is occupied by itself, so is never a move
+                    if (x, y) not in self.occupancy and self.world.tiles[x][y].get_type() in unit.allowed_moves:
                         moves.append([x, y])
 
         return moves
 
     def move_unit(self, position, unit):
+        self.revision += 1
+        self.record(commands.Move(list(unit.position), list(position)))
+        self.vacate(unit)
         unit.move(position)
+        self.occupy(unit)
 
     def get_attacks(self, unit):
         attacks = []
         if not unit.has_attacked():
-            for x in range(unit.position[0] - unit.reach, unit.position[0] + unit.reach + 1):
-                for y in range(unit.position[1] - unit.reach, unit.position[1] + unit.reach + 1):
-                    if [x, y] != unit.position and self.get_unit([x, y]):
-                        if self.get_unit([x, y]).owner != self.current_player_name:
-                            attacks.append([x, y])
+            for x in get_range(unit.position[0], unit.reach, constants.MAP_SIZE[0]):
+                for y in get_range(unit.position[1], unit.reach, constants.MAP_SIZE[1]):
+                    target = self.occupancy.get((x, y))
+                    if target is not None and target is not unit and target.owner != self.current_player_name:
+                        attacks.append([x, y])
         return attacks
 
+    def legal_actions(self):
+        """ lazily yields every command the current player can make. The model must not change while iterating. """
+        if self.game_end:
+            return
+
+        player = self.get_current_player()
+        for unit in player.units:
+            if self.check_conquer(unit):
+                yield commands.Conquer(unit.position)
+            for position in self.get_moves(unit):
+                yield commands.Move(unit.position, position)
+            for position in self.get_attacks(unit):
+                yield commands.Attack(unit.position, position)
+
+        for city_position in player.settlements:
+            if not self.unit_selected(city_position):
+                for unit_type, specs in constants.UNIT_SPECS.items():
+                    if player.get_ap() >= specs["spawn_cost"]:
+                        yield commands.Spawn(unit_type, city_position)
+
+            city = self.world.get_tile(city_position)
+            if not city.at_max() and city.afford_upgrade():
+                yield commands.Upgrade(city_position)
+
+        yield commands.EndTurn()
+
+
+def get_range(centre, distance, size):
+    """ indexes within distance of centre, that are on the map (0 to size) """
+    return range(max(centre - distance, 0), min(centre + distance + 1, size))
+
 
 class Player:
     """ Each player of the game, which holds their units, key values and links to settlements etc"""
@@ -173,6 +250,7 @@ class Player:
 
         self.name = saved_data["name"]
         self.colour = saved_data["colour"]
+        self.ai = saved_data.get("ai")  # games saved before computer players have no "ai"
         self.camera_focus = saved_data["camera_focus"]
         self.show_minimap = saved_data["show_minimap"]
 
@@ -191,6 +269,7 @@ class Player:
         return {
             "name": self.get_name(),
             "colour": self.get_colour(),
+            "ai": self.get_ai(),
             "camera_focus": self.get_camera_focus(),
             "show_minimap": self.get_minimap_status(),
 
@@ -211,11 +290,19 @@ class Player:
 
     def kill(self):
         self.dead = True
+        for unit in self.units:
+            self.model_link.vacate(unit)
         self.units.clear()
 
     def get_colour(self):
         return self.colour
 
+    def get_ai(self):
+        return self.ai
+
+    def is_ai(self):
+        return self.ai is not None
+
     def get_turn(self):
         return self.turn
 
@@ -268,9 +355,11 @@ class Player:
 
     def add_unit(self, unit):
         self.units.append(unit)
+        self.model_link.occupy(unit)
 
     def delete_unit(self, unit):
         self.units.remove(unit)
+        self.model_link.vacate(unit)
 
     def get_camera_focus(self):
         return self.camera_focus
@@ -286,17 +375,11 @@ class Player:
 
 
 class Tile:
-    def __init__(self, save_data):
-        self.type = save_data["type"]
-        self.position = save_data["position"]
+    def __init__(self, tile_type, position):  # tile has no save data, its type is saved in World.format
+        self.type = tile_type
+        self.position = position
         # self.wood, self.stone, self.metal = constants.TILE_DATA[tile_type]
 
-    def get_save_data(self):
-        return {
-            "type": self.type,
-            "position": self.position
-        }
-
     def get_type(self):
         return self.type
 
@@ -392,6 +475,8 @@ class City:
     def add_sub_level(self):
         current_holder = self.model_link.get_player(self.current_holder)
 
+        self.model_link.revision += 1
+        self.model_link.record(commands.Upgrade(list(self.position)))
         current_holder.take_ap(self.get_upgrade_cost())
         self.sub_level += 1
         if not self.at_max():
@@ -437,23 +522,29 @@ class World:
     def __init__(self, model_link, save_data):  # __init__ creates new world or loads from save_data
         self.model_link = model_link
 
-        self.format = save_data["format"]
+        self.format = save_data["format"]  # [row][col] of tile types
+
+        if "cities" in save_data:
+            cities = save_data["cities"]
+        else:  # saved before cities were kept apart, when every tile was saved
+            cities = [tile_data for row in save_data["tiles"] for tile_data in row if tile_data["type"] == "c"]
+        cities = {tuple(city_data["position"]): city_data for city_data in cities}
 
         # Load Tiles
         self.tiles = []
-        for row in save_data["tiles"]:  # assumes col 0, is same len as all others.
+        for row, row_format in enumerate(self.format):
             self.tiles.append([])
 
-            for tile_data in row:
-                if tile_data["type"] == "c":
-                    self.tiles[-1].append(City(self.model_link, tile_data))
+            for col, tile_type in enumerate(row_format):
+                if tile_type == "c":
+                    self.tiles[-1].append(City(self.model_link, cities[(row, col)]))
                 else:
-                    self.tiles[-1].append(Tile(tile_data))  # tile has no additional save data
+                    self.tiles[-1].append(Tile(tile_type, [row, col]))
 
     def get_save_data(self):
         return {
             "format": self.format,
-            "tiles": [[tile.get_save_data() for tile in row] for row in self.tiles]
+            "cities": [tile.get_save_data() for row in self.tiles for tile in row if tile.get_type() == "c"]
         }
 
     def get_tile(self, position):
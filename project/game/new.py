@@ -1,37 +1,48 @@
-import os
 import random
 
 import constants
 import paths
 import project.data as data
+import project.game.journal as journal
+import project.game.delta as delta
+import project.game.model as model
 
 
-# Make a new game, by adding the base data to the json save format.
-def make(game_name, map_name, players):
+# Make a new game, by adding the base data to the save format.
+def make(game_name, map_name, players, seed=None):
+    game_data = get_game_data(game_name, map_name, players, seed)
+
+    if journal.can_replay(game_name):  # a finished game's, kept so it can be replayed
+        raise FileExistsError("Game Name Taken By A Replay: %s" % game_name)
+    journal.delete(game_name)  # any left without keyframes can't be replayed
+    delta.compact(model.Model(game_data), game_name)
+
+
+def get_game_data(game_name, map_name, players, seed=None):
+    """ every random choice is made from seed, so the same seed always makes the same game """
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+    rng = random.Random(seed)
 
-    # Generating Game Data
     game_data = {
         "game_name": game_name,
         "map_name": map_name,
+        "seed": seed,
         "game_end": False,
         "current_player": None,  # will be generated on load.
-        "players": [get_player_data(player["name"], player["colour"]) for player in players],
-        "world": get_world_data(map_name)
+        "players": [get_player_data(player["name"], player["colour"], player.get("ai"))
+                    for player in players],
+        "world": get_world_data(map_name, rng)
     }
 
-    game_data = assign_spawns(game_data)
-
-    # Creating 'saved' directory if it doesn't exist.
-    if not os.path.exists(paths.gamePath):
-        os.mkdir(paths.gamePath)
-
-    data.save(game_data, paths.gamePath + game_name)
+    return assign_spawns(game_data, rng)
 
 
-def get_player_data(player_name, player_colour):
+def get_player_data(player_name, player_colour, ai=None):
     return {
         "name": player_name,
         "colour": player_colour,
+        "ai": ai,  # difficulty of a computer player, None for people
         "camera_focus": [None, None],  # will be generated on load.
         "show_minimap": True,
 
@@ -45,45 +56,43 @@ def get_player_data(player_name, player_colour):
         }
 
 
-def get_world_data(map_name):
+def get_world_data(map_name, rng):
     world_data = {
         "format": data.load_map_format(paths.mapPath + map_name + ".csv"),
     }
-    world_data["tiles"] = get_world_tiles_data(world_data["format"])
+    world_data["cities"] = get_world_cities_data(world_data["format"], rng)
 
     return world_data
 
 
 class CityPicker:
     """ used to randomly assign names to cities """
-    def __init__(self):
+    def __init__(self, rng):
+        self.rng = rng
+
         # Load Name Choices
         with open(paths.dataPath + "city_names") as file:
             self.name_choices = file.read().split("\n")
 
     def get_new(self):
-        choice = random.choice(self.name_choices)
+        choice = self.rng.choice(self.name_choices)
         self.name_choices.remove(choice)
         return choice
 
 
-def get_world_tiles_data(map_format):
+def get_world_cities_data(map_format, rng):
+    """ other tiles have no data of their own, their type is kept in the format """
 
-    city_names = CityPicker()  # A small wrapper around the city_names file allowing the selection of unique names.
+    city_names = CityPicker(rng)  # A small wrapper around the city_names file allowing the selection of unique names.
 
-    # Make Tiles
-    tiles = []
+    # Make Cities
+    cities = []
     for row in range(len(map_format[0])):  # assumes col 0, is same len as all others!
-        tiles.append([])
-
         for col in range(len(map_format)):
-            tile_type = map_format[row][col]
-            tile_position = [row, col]
-
-            if tile_type == "c":
-                tiles[-1].append({
-                    "type": tile_type,
-                    "position": tile_position,
+            if map_format[row][col] == "c":
+                cities.append({
+                    "type": "c",
+                    "position": [row, col],
 
                     "name": city_names.get_new(),
                     "current_holder": None,
@@ -91,23 +100,18 @@ def get_world_tiles_data(map_format):
                     "sub_level": 0,
                     "max_level": len(constants.LEVELS),
                 })
-            else:
-                tiles[-1].append({
-                    "type": tile_type,
-                    "position": tile_position
-                })
 
-    return tiles
+    return cities
 
 
-def assign_spawns(game_data):
-    spawn_choices = [tile["position"] for row in game_data["world"]["tiles"] for tile in row if tile["type"] == "c"]
+def assign_spawns(game_data, rng):
+    spawn_choices = list(game_data["world"]["cities"])
     for player in game_data["players"]:
-        city_position = random.choice(spawn_choices)
-        spawn_choices.remove(city_position)
+        city = rng.choice(spawn_choices)
+        spawn_choices.remove(city)
 
         # There is a two way relationship, so both must know of each other.
-        player["settlements"].append(city_position)
-        game_data["world"]["tiles"][city_position[0]][city_position[1]]["current_holder"] = player["name"]
+        player["settlements"].append(city["position"])
+        city["current_holder"] = player["name"]
 
     return game_data
@@ -0,0 +1,182 @@
+import pygame
+
+import constants
+
+import pygame_gui
+import project.scheduler as scheduler
+import project.game.commands as commands
+import project.game.engine as engine
+import project.game.journal as journal
+import project.game.model as model
+import project.game.scroll as scroll
+import project.game.view as view
+import project.game.gui as gui
+
+
+class Replay:
+    """ steps through a game's journal. Steps are made and unmade by the engine, seeks start from a keyframe """
+    def __init__(self, game_reference):
+        self.game_reference = game_reference
+        self.commands = journal.load_commands(game_reference)
+        self.keyframes = journal.get_keyframes(game_reference)
+        if not self.keyframes:
+            raise FileNotFoundError("No Replay For: %s" % game_reference)
+
+        # position each turn starts at, ie after each end turn
+        self.turns = [0] + [index + 1 for index, command in enumerate(self.commands)
+                            if isinstance(command, commands.EndTurn)]
+
+        self.engine = None
+        self.position = None  # number of commands made
+        self.seek(0)
+
+    def get_model(self):
+        return self.engine.get_model()
+
+    def get_position(self):
+        return self.position
+
+    def get_length(self):
+        return len(self.commands)
+
+    def get_turn(self):
+        return len([position for position in self.turns if position <= self.position]) - 1
+
+    def get_turn_count(self):
+        return len(self.turns)
+
+    def seek(self, position):
+        """ loads the last keyframe at or before position, then makes the commands after it """
+        position = max(0, min(position, len(self.commands)))
+        keyframe = max([keyframe for keyframe in self.keyframes if keyframe <= position], default=self.keyframes[0])
+
+        self.engine = engine.Engine(model.Model(journal.load_keyframe(self.game_reference, keyframe)))
+        self.position = keyframe
+        while self.position < position:
+            self.step_forward()
+
+    def seek_turn(self, turn):
+        self.seek(self.turns[max(0, min(turn, len(self.turns) - 1))])
+
+    def step_forward(self):
+        """ returns the command made, or None at the end of the journal """
+        if self.position >= len(self.commands):
+            return None
+        command = self.commands[self.position]
+        if not self.engine.make(command):
+            raise ValueError("Journal Command Can't Be Replayed: %s" % (command,))
+        self.position += 1
+        return command
+
+    def step_back(self):
+        """ returns the command unmade, or None at the start of the journal """
+        if self.position <= self.keyframes[0]:
+            return None
+        command = self.commands[self.position - 1]
+        if not self.engine.unmake():  # commands before this were loaded from a keyframe, so must seek to undo
+            self.seek(self.position - 1)
+        else:
+            self.position -= 1
+        return command
+
+
+class ReplayViewer:
+    """ shows a replay, arrow keys step between commands and page up/down between turns """
+    def __init__(self, display, game_reference):
+        self.display = display
+        self.state = "replay"
+        self.frames = scheduler.FrameScheduler()
+        self.replay = Replay(game_reference)
+
+        self.game_view = None
+        self.camera = None
+        self.mini_map = None
+        self.player_tracker = None
+        self.load_view()
+
+        self.panel = pygame_gui.Panel([0, constants.DISPLAY_SIZE[1] - 25, constants.DISPLAY_SIZE[0], 25], 150,
+                                      constants.COLOURS["panel"])
+        self.position_text = pygame_gui.Text(
+            "",
+            constants.FONTS["sizes"]["medium"], constants.FONTS["colour"], constants.FONTS["main"],
+            self.mini_map.panel_size[0] + 10, constants.DISPLAY_SIZE[1] - 23)
+        self.update_text(None)
+
+    def load_view(self):
+        """ views hold the model they show, so are made again when a seek loads a new one """
+        camera_position = self.camera.get_position() if self.camera is not None else None
+
+        self.game_view = view.PhysicalGame(self.display, self.replay.get_model(), self)
+        self.camera = scroll.Camera(self.display, self.game_view.game_surface, 25, 6)
+        if camera_position is not None:
+            self.camera.set_position(camera_position)
+        self.mini_map = gui.MiniMap(self.replay.get_model(), self.camera)
+        self.player_tracker = gui.PlayerTracker(self.replay.get_model())
+        self.player_tracker.update_player()
+
+    def run(self):
+        scrolling = False
+        while self.state == "replay":
+            events = self.frames.get_events(idle=not scrolling)
+
+            mouse_x, mouse_y = pygame.mouse.get_pos()
+            scrolling = False
+            if pygame.mouse.get_focused():
+                scrolling = self.camera.handle_scroll(mouse_x, mouse_y, [])
+
+            for event in events:
+                if event.type == pygame.QUIT:
+                    self.state = "quit"
+
+                elif event.type == pygame.KEYDOWN:
+                    self.handle_key(event.key)
+
+                elif event.type == pygame.MOUSEBUTTONDOWN:
+                    self.mini_map.handle_click()
+
+            self.draw()
+            pygame.display.update()
+            self.frames.tick()
+
+        return self.state
+
+    def handle_key(self, key):
+        model_link = self.replay.get_model()
+        command = None
+        if key == pygame.K_ESCAPE:
+            self.state = "quit"
+        elif key == pygame.K_RIGHT:
+            command = self.replay.step_forward()
+        elif key == pygame.K_LEFT:
+            command = self.replay.step_back()
+        elif key == pygame.K_PAGEDOWN:
+            self.replay.seek_turn(self.replay.get_turn() + 1)
+        elif key == pygame.K_PAGEUP:
+            self.replay.seek_turn(self.replay.get_turn() - 1)
+        elif key == pygame.K_HOME:
+            self.replay.seek(0)
+        elif key == pygame.K_END:
+            self.replay.seek(self.replay.get_length())
+        else:
+            return
+
+        if self.replay.get_model() is not model_link:  # seeked, so there is a new model to show
+            self.load_view()
+        elif isinstance(command, (commands.Conquer, commands.Upgrade)):
+            self.game_view.world.get_tile(command.position).update_image()  # level and holder might have changed
+        self.player_tracker.update_player()
+        self.update_text(command)
+
+    def update_text(self, command):
+        text = "turn %s/%s, command %s/%s" % (self.replay.get_turn(), self.replay.get_turn_count() - 1,
+                                              self.replay.get_position(), self.replay.get_length())
+        if command is not None:
+            text += ": %s" % " ".join(str(value) for value in commands.to_data(command))
+        self.position_text.change_text(text + "   (arrows: step, page up/down: turn, esc: quit)")
+
+    def draw(self):
+        self.game_view.draw(self.display)
+        self.player_tracker.draw(self.display)
+        self.panel.draw(self.display)
+        self.position_text.draw(self.display)
+        self.mini_map.draw(self.display)
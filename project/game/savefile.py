@@ -0,0 +1,188 @@
+# Binary game saves. Save data (as Model.get_save_data) is packed as:
+#   header: MAGIC, then the format VERSION
+#   meta: length prefixed json of everything small, game and player settings, city names and a table of unit types
+#   terrain: a byte per tile, its type character, row by row (World's "format")
+#   cities: fixed width records in the order of World's "cities", each holder an index into the players
+#   units: fixed width records, each referencing its owner and one of the unit types in meta, in order of play
+# Saves from before this format are json, and are migrated the first time they are loaded.
+
+import json
+import os
+import struct
+
+import project.data as data
+import project.game.model as model
+
+MAGIC = b"CoES"
+VERSION = 1  # bumped whenever the layout changes, with a reader kept for each older version
+
+HEADER = struct.Struct("<4sH")  # magic, version
+LENGTH = struct.Struct("<I")  # length of the meta json
+GRID = struct.Struct("<BB")  # terrain rows, cols
+COUNT = struct.Struct("<H")  # records following
+CITY_RECORD = struct.Struct("<BBbBBB")  # row, col, holder (-1 for none), level, sub_level, max_level
+UNIT_RECORD = struct.Struct("<BBBBhB")  # owner, unit type, row, col, health, flags
+MOVED, ATTACKED = 1, 2  # unit flags
+
+PLAYER_FIELDS = ["name", "colour", "ai", "camera_focus", "show_minimap", "settlements", "turn", "ap", "dead",
+                 "max_score"]
+UNIT_TYPE_FIELDS = ["type", "max_health", "attack", "defence", "movement", "reach", "allowed_moves"]
+
+# Raised reading a file that is corrupt, cut short or not a save at all (json errors are ValueErrors).
+LOAD_ERRORS = (OSError, ValueError, KeyError, IndexError, TypeError, struct.error)
+
+
+def get_path(filename):
+    return filename + ".save"
+
+
+def get_legacy_path(filename):
+    return filename + ".json"
+
+
+def exists(filename):
+    return data.check_exists(get_path(filename)) or data.check_exists(get_legacy_path(filename))
+
+
+def save(save_data, filename):
+    """ packed on the save writer's thread, so save_data must not be changed after (as data.save) """
+    data.save_encoded(save_data, get_path(filename), pack)
+
+
+def load(filename):
+    data.flush()
+    if not os.path.isfile(get_path(filename)):
+        return migrate(filename)
+    return read(filename)
+
+
+def read(filename):
+    """ as load, but neither waits on the save writer nor migrates, so can be used off the main thread.
+    Reads what is on disk, which might be older than a save still waiting to be written """
+    if os.path.isfile(get_path(filename)):
+        with open(get_path(filename), "rb") as file:
+            return unpack(file.read())
+    with open(get_legacy_path(filename), "r") as file:
+        return json.load(file)
+
+
+def migrate(filename):
+    """ loads a json save, rewriting it in this format """
+    save_data = model.Model(data.load(filename)).get_save_data()  # the model loads every older layout
+    save(save_data, filename)
+    data.delete(filename)
+    return save_data
+
+
+def delete(filename):
+    data.remove(get_path(filename))
+    data.delete(filename)  # if never migrated
+
+
+def pack(save_data):
+    players = save_data["players"]
+    player_index = {player["name"]: index for index, player in enumerate(players)}
+    world_format = save_data["world"]["format"]
+    cities = save_data["world"]["cities"]
+
+    unit_types = []  # each distinct set of specs, so units saved before a spec was changed keep theirs
+    unit_records = []
+    for player in players:
+        for unit in player["units"]:
+            unit_type = [unit[field] for field in UNIT_TYPE_FIELDS]
+            if unit_type not in unit_types:
+                unit_types.append(unit_type)
+            unit_records.append(UNIT_RECORD.pack(
+                player_index[unit["owner"]], unit_types.index(unit_type), unit["position"][0], unit["position"][1],
+                unit["health"], (unit["moved"] and MOVED) | (unit["attacked"] and ATTACKED)))
+
+    meta = json.dumps({
+        "game_name": save_data["game_name"],
+        "map_name": save_data["map_name"],
+        "game_end": save_data["game_end"],
+        "seed": save_data["seed"],
+        "saves": save_data.get("saves", 0),  # new games have none yet
+        "current_player": save_data["current_player"],
+        "players": [{field: player[field] for field in PLAYER_FIELDS} for player in players],
+        "cities": [city["name"] for city in cities],
+        "unit_types": unit_types,
+    }, separators=(",", ":")).encode("utf-8")
+
+    return b"".join([
+        HEADER.pack(MAGIC, VERSION),
+        LENGTH.pack(len(meta)), meta,
+        GRID.pack(len(world_format), len(world_format[0])), "".join(map("".join, world_format)).encode("ascii"),
+        COUNT.pack(len(cities)),
+        b"".join(CITY_RECORD.pack(city["position"][0], city["position"][1],
+                                  player_index.get(city["current_holder"], -1),
+                                  city["level"], city["sub_level"], city["max_level"]) for city in cities),
+        COUNT.pack(len(unit_records)), b"".join(unit_records),
+    ])
+
+
+def unpack(packed):
+    magic, version = HEADER.unpack_from(packed)
+    if magic != MAGIC:
+        raise ValueError("Not A Game Save")
+    if version not in READERS:
+        raise ValueError("Unknown Save Version: %s, saved by a newer version of the game?" % version)
+    return READERS[version](packed, HEADER.size)
+
+
+def read_v1(packed, offset):
+    length, = LENGTH.unpack_from(packed, offset)
+    offset += LENGTH.size
+    meta = json.loads(packed[offset:offset + length].decode("utf-8"))
+    offset += length
+
+    rows, cols = GRID.unpack_from(packed, offset)
+    offset += GRID.size
+    terrain = packed[offset:offset + rows * cols].decode("ascii")
+    offset += rows * cols
+    world_format = [list(terrain[row * cols:(row + 1) * cols]) for row in range(rows)]
+
+    players = meta["players"]
+    count, = COUNT.unpack_from(packed, offset)
+    offset += COUNT.size
+    city_records = CITY_RECORD.iter_unpack(packed[offset:offset + count * CITY_RECORD.size])
+    cities = [{
+        "type": "c",
+        "name": name,
+        "position": [row, col],
+        "level": level,
+        "sub_level": sub_level,
+        "max_level": max_level,
+        "current_holder": players[holder]["name"] if holder >= 0 else None,
+    } for name, (row, col, holder, level, sub_level, max_level) in zip(meta["cities"], city_records)]
+    offset += count * CITY_RECORD.size
+
+    for player in players:
+        player["units"] = []
+    count, = COUNT.unpack_from(packed, offset)
+    offset += COUNT.size
+    for owner, unit_type, row, col, health, flags in UNIT_RECORD.iter_unpack(
+            packed[offset:offset + count * UNIT_RECORD.size]):
+        unit = dict(zip(UNIT_TYPE_FIELDS, meta["unit_types"][unit_type]))
+        unit.update({
+            "position": [row, col],
+            "health": health,
+            "moved": bool(flags & MOVED),
+            "attacked": bool(flags & ATTACKED),
+            "owner": players[owner]["name"],
+        })
+        unit["allowed_moves"] = list(unit["allowed_moves"])  # not shared between units of a type
+        players[owner]["units"].append(unit)
+
+    return {
+        "game_name": meta["game_name"],
+        "map_name": meta["map_name"],
+        "game_end": meta["game_end"],
+        "seed": meta["seed"],
+        "saves": meta["saves"],
+        "current_player": meta["current_player"],
+        "players": players,
+        "world": {"format": world_format, "cities": cities},
+    }
+
+
+READERS = {1: read_v1}  # version: function reading the rest of a save of that version, from after the header
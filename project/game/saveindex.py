@@ -0,0 +1,94 @@
+# Index of what the load menu shows of each saved game, so listing games never loads them.
+# Kept in memory once read, and written again (by the save writer) whenever a game is saved or deleted.
+
+import os
+import time
+
+import paths
+import project.data as data
+import project.game.savefile as savefile
+
+
+def get_path():
+    return paths.dataPath + "save_index"
+
+
+def get_entry(save_data, modified=None):
+    return {
+        "map": save_data["map_name"],
+        "turn": max(player["turn"] for player in save_data["players"]),
+        "players": [player["name"] for player in save_data["players"]],
+        "modified": time.time() if modified is None else modified,
+    }
+
+
+def get_entries():
+    return index.get_entries()
+
+
+def update(game_reference, save_data):
+    index.update(game_reference, save_data)
+
+
+def remove(game_reference):
+    index.remove(game_reference)
+
+
+def get_saved_games():
+    """ {game_reference: path} of the saves on disk """
+    data.flush()  # so saves and deletes still being written are listed correctly
+    os.makedirs(paths.gamePath, exist_ok=True)
+    saved_games = {}
+    for filename in os.listdir(paths.gamePath):
+        game_reference, extension = os.path.splitext(filename)
+        if extension in [".save", ".json"] and os.path.isfile(paths.gamePath + filename):  # json if not migrated
+            saved_games[game_reference] = paths.gamePath + filename
+    return saved_games
+
+
+class SaveIndex:
+    def __init__(self):
+        self.entries = None  # {game_reference: entry, as get_entry}, read from disk when first needed
+
+    def get_entries(self):
+        """ {game_reference: entry} of every saved game. Games saved or deleted without the index being updated,
+        ie by older versions, are found by listing the saves, and only those are loaded """
+        self.load()
+        saved_games = get_saved_games()
+        changed = False
+
+        for game_reference in set(saved_games) - set(self.entries):
+            try:
+                save_data = savefile.read(paths.gamePath + game_reference)  # the writer was flushed by listing
+                entry = get_entry(save_data, os.path.getmtime(saved_games[game_reference]))
+            except savefile.LOAD_ERRORS:  # not a game, or corrupt, so it isn't listed
+                continue
+            self.entries[game_reference] = entry
+            changed = True
+        for game_reference in set(self.entries) - set(saved_games):
+            del self.entries[game_reference]
+            changed = True
+
+        if changed:
+            self.write()
+        return self.entries
+
+    def update(self, game_reference, save_data):
+        self.load()
+        self.entries[game_reference] = get_entry(save_data)
+        self.write()
+
+    def remove(self, game_reference):
+        self.load()
+        if self.entries.pop(game_reference, None) is not None:
+            self.write()
+
+    def load(self):
+        if self.entries is None:
+            self.entries = data.load(get_path()) if data.check_exists(get_path() + ".json") else {}
+
+    def write(self):
+        data.save(dict(self.entries), get_path())  # a copy, as entries can change before it is written
+
+
+index = SaveIndex()
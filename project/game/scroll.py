@@ -38,18 +38,25 @@ class Camera:
 
     def handle_scroll(self, mouseX, mouseY, excluded_areas):
         # exluded_areas is list of rects, in which triggering scrolling should't occur
+        # returns True if the surface was scrolled
+        scrolled = False
         if not self.in_excluded(mouseX, mouseY, excluded_areas):
             if self.top_margin.collidepoint(mouseX, mouseY) and not self.at_surface_top():
                 self.scroll_down()
+                scrolled = True
 
             if self.bottom_margin.collidepoint(mouseX, mouseY) and not self.at_surface_bottom():
                 self.scroll_up()
+                scrolled = True
 
             if self.left_margin.collidepoint(mouseX, mouseY) and not self.at_surface_left():
                 self.scroll_right()
+                scrolled = True
 
             if self.right_margin.collidepoint(mouseX, mouseY) and not self.at_surface_right():
                 self.scroll_left()
+                scrolled = True
+        return scrolled
                 
     def at_surface_top(self):
         if self.scroll_surface.rect.y >= 0:
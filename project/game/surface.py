@@ -12,5 +12,10 @@ class Surface:
     def get_position(self):
         return self.rect.topleft
 
+    def get_view_rect(self, display):
+        """ area of main_surface currently visible on display, in main_surface coordinates """
+        return display.get_rect().move(-self.rect.x, -self.rect.y).clip(self.main_surface.get_rect())
+
     def draw(self, display):
-        display.blit(self.main_surface, [self.rect.x, self.rect.y])
+        view = self.get_view_rect(display)  # only blit on-screen part, most of the surface is off-screen
+        display.blit(self.main_surface, [self.rect.x + view.x, self.rect.y + view.y], view)
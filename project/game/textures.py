@@ -0,0 +1,24 @@
+import pygame
+
+import constants
+
+# Process-wide caches, so each asset is decoded from disk at most once however many tiles or games use it.
+images = {}  # path: surface
+tinted_images = {}  # (mask path, colour name): surface
+
+
+def get_image(path):
+    """ the image at path, loaded and converted on first use. Surfaces are shared, so must not be drawn on. """
+    if path not in images:
+        images[path] = pygame.image.load(path).convert_alpha()
+    return images[path]
+
+
+def get_tinted(mask_path, colour):
+    """ the silhouette of the mask image filled with a colour from constants.COLOURS, made on first use """
+    key = (mask_path, colour)
+    if key not in tinted_images:
+        mask = pygame.mask.from_surface(get_image(mask_path))
+        tinted_images[key] = mask.to_surface(setcolor=constants.COLOURS[colour],
+                                             unsetcolor=(0, 0, 0, 0)).convert_alpha()
+    return tinted_images[key]
@@ -0,0 +1,113 @@
+# Small minimap style pictures of saved games, for the load menu. Each is cached as a png next to its save, made
+# again when the save is newer. Those missing are made on a worker thread, so showing them never waits on a load.
+
+import io
+import os
+import threading
+
+import pygame
+
+import constants
+import paths
+import project.data as data
+import project.game.engine as engine
+import project.game.gui as gui
+import project.game.savefile as savefile
+
+TILE_SIZE = 2
+BORDER = 3
+SIZE = [TILE_SIZE*constants.MAP_SIZE[0] + BORDER*2, TILE_SIZE*constants.MAP_SIZE[1] + BORDER*2]
+
+
+def get_path(game_reference):
+    return paths.gamePath + game_reference + "-thumbnail.png"
+
+
+def delete(game_reference):
+    data.remove(get_path(game_reference))
+
+
+def save(game_model, game_reference):
+    """ draws the game as it is, returning the picture, which is encoded and written by the save writer """
+    surface = render(game_model)
+    data.save_encoded(surface, get_path(game_reference), encode)
+    return surface
+
+
+def render(game_model):
+    surface = pygame.Surface(SIZE)
+    surface.fill(constants.COLOURS["panel"])
+    for row in game_model.world.tiles:
+        for tile in row:
+            colour = gui.get_minimap_colour(tile, game_model)
+            if colour is not None:
+                position = tile.get_position()  # rows run left to right, as the minimap
+                surface.fill(colour, [BORDER + position[0]*TILE_SIZE, BORDER + position[1]*TILE_SIZE,
+                                      TILE_SIZE, TILE_SIZE])
+    return surface
+
+
+def encode(surface):
+    file = io.BytesIO()
+    pygame.image.save(surface, file, "thumbnail.png")  # name only tells pygame the format
+    return file.getvalue()
+
+
+def load_or_make(game_reference, modified):
+    """ the cached thumbnail if made since the game was last saved (modified), else a new one """
+    path = get_path(game_reference)
+    if os.path.isfile(path) and os.path.getmtime(path) >= modified:
+        return pygame.image.load(path)
+
+    return save(engine.read(game_reference).get_model(), game_reference)  # load would take the writer's errors
+
+
+class ThumbnailCache:
+    """ thumbnails loaded or made so far, kept between visits to the load menu """
+    def __init__(self):
+        self.thumbnails = {}  # {game_reference: [modified, surface]}, surface None until ready
+        self.requests = []  # [game_reference, modified] waiting for the worker, oldest first
+        self.busy = False
+        self.condition = threading.Condition()
+        self.thread = None
+
+    def get(self, game_reference, modified):
+        """ thumbnail of the game as saved at modified (from project.game.saveindex), None if not ready yet """
+        with self.condition:
+            thumbnail = self.thumbnails.get(game_reference)
+            if thumbnail is not None and thumbnail[0] == modified:
+                return thumbnail[1]
+
+            self.thumbnails[game_reference] = [modified, None]
+            self.requests.append([game_reference, modified])
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, daemon=True)  # never keeps a closed game running
+                self.thread.start()
+            self.condition.notify_all()
+        return None
+
+    def is_busy(self):
+        """ True while thumbnails asked for are still being made, so the menu keeps drawing to show them """
+        with self.condition:
+            return self.busy or bool(self.requests)
+
+    def run(self):
+        while True:
+            with self.condition:
+                while not self.requests:
+                    self.condition.wait()
+                game_reference, modified = self.requests.pop(0)
+                self.busy = True
+
+            try:
+                surface = load_or_make(game_reference, modified)
+            except savefile.LOAD_ERRORS + (pygame.error,):  # can't be loaded, so is listed without a thumbnail
+                surface = None
+
+            with self.condition:
+                if self.thumbnails.get(game_reference, [None])[0] == modified:  # not saved again since asked
+                    self.thumbnails[game_reference] = [modified, surface]
+                self.busy = False
+
+
+thumbnails = ThumbnailCache()
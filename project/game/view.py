@@ -1,7 +1,9 @@
 import pygame
 
 import project.game.isometric as isometric
+import project.game.commands as commands
 import project.game.surface as surface
+import project.game.textures as textures
 
 import project.background as background
 import pygame_gui
@@ -18,7 +20,8 @@ class PhysicalGame:
         self.GUI = GUI
 
         # Background
-        self.stars = background.Starscape(self.display.get_rect())
+        self.stars = background.Starscape(self.display.get_rect(), constants.STAR_LAYERS,
+                                          seed=self.model_link.get_seed())
 
         # General Setup (surface + camera)
         self.game_surface = surface.Surface(constants.GAME_RECT)
@@ -27,49 +30,26 @@ class PhysicalGame:
         # Map Setup
         self.world = VisualWorld(self.model_link)
 
+        self.view_rect = self.game_surface.get_view_rect(self.display)  # updated each draw, tiles outside are culled
+
         # Focuses
         self.tile_focus = None  # record of the current tile clicked
         self.active_unit = None  # record of current unit clicked on
 
-        # Units Image Setup
+        # Units Image Setup (player coloured unit images are tinted from each unit type's mask when first drawn)
         self.unit_images = {
-            "base-unit": pygame.image.load(paths.unitPath + "base-unit.png").convert_alpha(),
-            "unit-counter": pygame.image.load(paths.unitPath + "unit-counter.png").convert_alpha(),
-
-            "blue-scout": pygame.image.load(paths.unitPath + "blue-scout.png").convert_alpha(),
-            "blue-swordsman": pygame.image.load(paths.unitPath + "blue-swordsman.png").convert_alpha(),
-            "blue-archer": pygame.image.load(paths.unitPath + "blue-archer.png").convert_alpha(),
-            "blue-horseman": pygame.image.load(paths.unitPath + "blue-horseman.png").convert_alpha(),
-            "blue-catapult": pygame.image.load(paths.unitPath + "blue-catapult.png").convert_alpha(),
-
-            "yellow-scout": pygame.image.load(paths.unitPath + "yellow-scout.png").convert_alpha(),
-            "yellow-swordsman": pygame.image.load(paths.unitPath + "yellow-swordsman.png").convert_alpha(),
-            "yellow-archer": pygame.image.load(paths.unitPath + "yellow-archer.png").convert_alpha(),
-            "yellow-horseman": pygame.image.load(paths.unitPath + "yellow-horseman.png").convert_alpha(),
-            "yellow-catapult": pygame.image.load(paths.unitPath + "yellow-catapult.png").convert_alpha(),
-
-            "green-scout": pygame.image.load(paths.unitPath + "green-scout.png").convert_alpha(),
-            "green-swordsman": pygame.image.load(paths.unitPath + "green-swordsman.png").convert_alpha(),
-            "green-archer": pygame.image.load(paths.unitPath + "green-archer.png").convert_alpha(),
-            "green-horseman": pygame.image.load(paths.unitPath + "green-horseman.png").convert_alpha(),
-            "green-catapult": pygame.image.load(paths.unitPath + "green-catapult.png").convert_alpha(),
-
-            "red-scout": pygame.image.load(paths.unitPath + "red-scout.png").convert_alpha(),
-            "red-swordsman": pygame.image.load(paths.unitPath + "red-swordsman.png").convert_alpha(),
-            "red-archer": pygame.image.load(paths.unitPath + "red-archer.png").convert_alpha(),
-            "red-horseman": pygame.image.load(paths.unitPath + "red-horseman.png").convert_alpha(),
-            "red-catapult": pygame.image.load(paths.unitPath + "red-catapult.png").convert_alpha(),
+            "base-unit": textures.get_image(paths.unitPath + "base-unit.png"),
+            "unit-counter": textures.get_image(paths.unitPath + "unit-counter.png"),
         }
 
         self.unit_action_images = {
-            "move": pygame.image.load(paths.unitPath + "move-indicator.png"),
-            "attack": pygame.image.load(paths.unitPath + "attack-indicator.png"),
-            "conquer": pygame.image.load(paths.unitPath + "conquer-indicator.png"),
+            "move": textures.get_image(paths.unitPath + "move-indicator.png"),
+            "attack": textures.get_image(paths.unitPath + "attack-indicator.png"),
+            "conquer": textures.get_image(paths.unitPath + "conquer-indicator.png"),
         }
 
-        self.unit_health_text = pygame_gui.Text("",
-            13, constants.FONTS["colour"], constants.FONTS["main"],
-            0, 0)  # changed during unit drawing
+        self.action_overlay = None  # [unit, model revision, moves, attacks, can conquer], reused while model unchanged
+        self.health_labels = {}  # health: rendered health number, so drawing units never renders text
 
     def map_clicked(self, mouse_x, mouse_y):
         focus = isometric.getIndex([mouse_x, mouse_y], self.game_surface.get_position())
@@ -80,6 +60,30 @@ class PhysicalGame:
         self.active_unit = None
         return False
 
+    def reset_focus(self):
+        self.tile_focus = None
+        self.active_unit = None
+
+    def apply_command(self, command):
+        """ makes a computer player's command, updating the view as the matching click would """
+        if isinstance(command, commands.Conquer):
+            holder = self.model_link.get_player(self.model_link.world.get_tile(command.position).get_holder())
+            if not self.GUI.engine.apply(command):
+                return False
+            self.world.get_tile(command.position).update_owner()
+
+            if holder is not None and holder.is_dead() and not self.model_link.game_ended():
+                self.GUI.send_message("Destroyed!", ["Unlucky %s " % holder.get_name(),
+                                                     "You have been destroyed and are",
+                                                     "out of the game."])
+            return True
+
+        if not self.GUI.engine.apply(command):
+            return False
+        if isinstance(command, commands.Upgrade):
+            self.world.get_tile(command.position).update_image()
+        return True
+
     def handled_unit_click(self):
         if self.model_link.unit_selected(self.tile_focus):
             if self.model_link.get_unit(self.tile_focus).owner == self.model_link.current_player_name:
@@ -100,8 +104,7 @@ class PhysicalGame:
         conquered = False
 
         if self.model_link.check_conquer(self.active_unit) and self.tile_focus == self.active_unit.position:
-            self.model_link.conquer(self.active_unit.position)
-            self.active_unit.make_inactive()
+            self.model_link.conquer(self.active_unit.position)  # also makes the unit inactive
             conquered = True
 
             # Death Checking - might have destroyed players last city
@@ -114,7 +117,6 @@ class PhysicalGame:
             self.GUI.send_message("Conquered!", ["You have successfully gained control",
                                                  "of %s" % self.model_link.world.get_tile(self.tile_focus).get_name()])
             self.GUI.player_tracker.update_player()
-            self.GUI.mini_map.refresh()
             self.world.get_tile(self.tile_focus).update_owner()
 
         return conquered
@@ -142,11 +144,10 @@ class PhysicalGame:
         return False
 
     def draw(self, display):
-        display.fill(constants.COLOURS["black"])
-        self.game_surface.main_surface.fill(constants.COLOURS["black"])
+        self.stars.draw(display, self.game_surface.get_position())  # pre-rendered and opaque, so also clears display
+        self.world.draw(self.game_surface.main_surface)  # terrain layer also clears last frame's units and overlays
 
-        self.stars.draw(display)
-        self.world.draw(self.game_surface.main_surface)
+        self.view_rect = self.game_surface.get_view_rect(display)
 
         if self.active_unit is not None:
             self.draw_action_overlay(self.active_unit)
@@ -155,36 +156,56 @@ class PhysicalGame:
 
         self.game_surface.draw(display)
 
+    def in_view(self, x, y):
+        return self.view_rect.colliderect([x, y, constants.TILE_WIDTH, constants.TILE_HEIGHT])
+
     def draw_units(self):
         for unit in self.model_link.all_units():
             x, y = isometric.get_iso(unit.position[0], unit.position[1], self.game_surface.get_position())
-            # Setting Unit Health Text
-            self.unit_health_text.change_text(str(unit.health))
-            self.unit_health_text.x = x + constants.TILE_WIDTH / 2 - 6
-            self.unit_health_text.y = y + constants.TILE_HEIGHT - 15
+            if not self.in_view(x, y):
+                continue
             # Drawing Unit
-            image_name = self.model_link.get_player(unit.owner).get_colour() + "-" + unit.type
+            unit_image = textures.get_tinted(paths.unitPath + unit.type + "-mask.png",
+                                             self.model_link.get_player(unit.owner).get_colour())
             self.game_surface.main_surface.blit(self.unit_images["base-unit"], [x, y])
             #self.game_surface.main_surface.blit(self.unit_images["unit-counter"], [x, y])
-            self.game_surface.main_surface.blit(self.unit_images[image_name], [x, y])
+            self.game_surface.main_surface.blit(unit_image, [x, y])
             # Drawing Unit Health Text
-            self.unit_health_text.draw(self.game_surface.main_surface)
+            self.game_surface.main_surface.blit(self.get_health_label(unit.health),
+                                                [x + constants.TILE_WIDTH / 2 - 6, y + constants.TILE_HEIGHT - 15])
+
+    def get_health_label(self, health):
+        if health not in self.health_labels:  # only a handful of health values are ever seen
+            self.health_labels[health] = pygame_gui.render_text(str(health), 13, constants.FONTS["colour"],
+                                                                constants.FONTS["main"])
+        return self.health_labels[health]
+
+    def get_action_overlay(self, unit):
+        if (self.action_overlay is None or self.action_overlay[0] is not unit or
+                self.action_overlay[1] != self.model_link.get_revision()):
+            self.action_overlay = [unit, self.model_link.get_revision(),
+                                   self.model_link.get_moves(unit),
+                                   self.model_link.get_attacks(unit),  # both lists of positions [[row,col]...]
+                                   self.model_link.check_conquer(unit)]
+        return self.action_overlay[2:]
 
     def draw_action_overlay(self, unit):
-        possible_moves = self.model_link.get_moves(unit)
-        possible_attacks = self.model_link.get_attacks(unit)  # both lists of positions [[row,col]...]
+        possible_moves, possible_attacks, can_conquer = self.get_action_overlay(unit)
 
         for move in possible_moves:
             x, y = isometric.get_iso(move[0], move[1], self.game_surface.get_position())
-            self.game_surface.main_surface.blit(self.unit_action_images["move"], [x, y])
+            if self.in_view(x, y):
+                self.game_surface.main_surface.blit(self.unit_action_images["move"], [x, y])
 
         for attack in possible_attacks:
             x, y = isometric.get_iso(attack[0], attack[1], self.game_surface.get_position())
-            self.game_surface.main_surface.blit(self.unit_action_images["attack"], [x, y])
+            if self.in_view(x, y):
+                self.game_surface.main_surface.blit(self.unit_action_images["attack"], [x, y])
 
-        if self.model_link.check_conquer(unit):
+        if can_conquer:
             x, y = isometric.get_iso(unit.position[0], unit.position[1], self.game_surface.get_position())
-            self.game_surface.main_surface.blit(self.unit_action_images["conquer"], [x, y])
+            if self.in_view(x, y):
+                self.game_surface.main_surface.blit(self.unit_action_images["conquer"], [x, y])
 
 
 def get_tile_image(tile_type):
@@ -224,17 +245,21 @@ def get_tile_position(row, col):
 class VisualTile:
     def __init__(self, tile_link):
         self.tile_link = tile_link
-        self.image = pygame.image.load(get_tile_image(self.tile_link.get_type())).convert_alpha()
+        self.image = textures.get_image(get_tile_image(self.tile_link.get_type()))
         self.x, self.y = get_tile_position(self.tile_link.get_position()[0], self.tile_link.get_position()[1])
         self.y = self.y - get_tile_offset(self.tile_link.get_type())
 
+    def get_rect(self):
+        return self.image.get_rect().move(self.x, self.y)
+
     def draw(self, surface):
         surface.blit(self.image, [self.x, self.y])
 
 
 class VisualCityTile:
-    def __init__(self, city_link, model_link):
+    def __init__(self, city_link, model_link, world_link):
         self.model_link = model_link
+        self.world_link = world_link  # notified so the cached terrain can be repainted on change
         self.city_link = city_link
         self.image = self.get_image()
         self.x, self.y = get_tile_position(self.city_link.get_position()[0], self.city_link.get_position()[1])
@@ -244,23 +269,32 @@ class VisualCityTile:
 
     def get_image(self):
         tile = paths.tilePath + "city-l" + str(self.city_link.get_level()) + ".png"  # ie: city-l1.png, city-l2.png...
-        return pygame.image.load(tile).convert_alpha()
+        return textures.get_image(tile)
 
     def get_indicator_image(self):
         if self.city_link.current_holder is not None:
             player = self.model_link.get_player(self.city_link.current_holder)
 
-            indicator = paths.tilePath + "l%s-%s.png" % (self.city_link.get_level(), player.get_colour())  # ie: l1-blue...
-            return pygame.image.load(indicator).convert_alpha()
+            indicator = paths.tilePath + "l%s-mask.png" % self.city_link.get_level()  # ie: l1-mask, l2-mask...
+            return textures.get_tinted(indicator, player.get_colour())
 
     # returns none to self.ownership_indicator, but wont be drawn at this point anyway.
 
     def update_image(self):
+        old_rect = self.get_rect()
         self.image = self.get_image()
-        self.update_owner()
+        self.ownership_indicator = self.get_indicator_image()
+        self.world_link.repaint(old_rect.union(self.get_rect()))
 
     def update_owner(self):
         self.ownership_indicator = self.get_indicator_image()
+        self.world_link.repaint(self.get_rect())
+
+    def get_rect(self):  # covers both the city image and the ownership indicator drawn below it
+        rect = self.image.get_rect().move(self.x, self.y)
+        if self.ownership_indicator is not None:
+            rect.union_ip(self.ownership_indicator.get_rect().move(self.x, self.y + get_tile_offset("c")))
+        return rect
 
     def draw(self, surface):
         surface.blit(self.image, [self.x, self.y])
@@ -269,9 +303,11 @@ class VisualCityTile:
 
 
 class VisualWorld:
+    """ terrain and settlement names, pre-rendered to a cached surface as they rarely change """
     def __init__(self, model):
         self.model_link = model
         model_tiles = self.model_link.world.tiles
+        self.surface = pygame.Surface([constants.GAME_RECT[2], constants.GAME_RECT[3]])
 
         self.tiles = []
         self.settlement_names = []
@@ -279,7 +315,7 @@ class VisualWorld:
             self.tiles.append([])
             for tile in row:
                 if tile.get_type() == "c":
-                    new_tile = VisualCityTile(tile, self.model_link)
+                    new_tile = VisualCityTile(tile, self.model_link, self)
                     # Create City Text
                     settlement_text = pygame_gui.Text(new_tile.city_link.get_name(), constants.FONTS["sizes"]["small"],
                                                       (255, 255, 255), constants.FONTS["main"],
@@ -291,13 +327,25 @@ class VisualWorld:
                     new_tile = VisualTile(tile)
                 self.tiles[len(self.tiles) - 1].append(new_tile)
 
+        self.repaint(self.surface.get_rect())
+
     def get_tile(self, position):
         return self.tiles[position[0]][position[1]]
 
-    def draw(self, surface):
+    def repaint(self, rect):
+        """ redraws every tile and name overlapping rect (in draw order) to the cached surface """
+        self.surface.set_clip(rect)
+        self.surface.fill(constants.COLOURS["black"])
+
         for row in self.tiles:
             for t in row:
-                t.draw(surface)
+                if t.get_rect().colliderect(rect):
+                    t.draw(self.surface)
 
         for name in self.settlement_names:
-            name.draw(surface)
+            name.draw(self.surface)  # clipped, so names outside rect are left untouched
+
+        self.surface.set_clip(None)
+
+    def draw(self, surface):
+        surface.blit(self.surface, [0, 0])
@@ -4,6 +4,8 @@ import constants
 import paths
 
 import pygame_gui
+import project.scene as scene
+import project.scheduler as scheduler
 
 
 class LeaderboardEditor:
@@ -63,10 +65,11 @@ class LeaderboardSlot:
         self.score_text.draw(display)
 
 
-class Leaderboard:
+class Leaderboard(scene.Scene):
     def __init__(self, display):
         self.display = display
         self.state = "leaderboard"
+        self.frames = scheduler.FrameScheduler()
 
         # Background Setup
         self.background = pygame_gui.Image(paths.uiMenuPath + "background.png", 0, 0)
@@ -99,7 +102,13 @@ class Leaderboard:
             constants.FONTS["sizes"]["medium"], constants.FONTS["colour"], constants.FONTS["main"],
             605, 150)
 
-        self.leaderboard_reader = LeaderboardEditor()
+        self.leaderboard_reader = None
+        self.slots = []
+
+    def enter(self):
+        self.state = "leaderboard"
+
+        self.leaderboard_reader = LeaderboardEditor()  # read each visit, as games won since add to it
         self.slots = []
         x, y = [300, 170]
         padding = 40  # between player slots
@@ -109,18 +118,17 @@ class Leaderboard:
             y += padding
             rank += 1
 
-        self.run()
-
     def run(self):
         while self.state == "leaderboard":
-            self.handle_events()
             self.draw()
+            self.handle_events()
+            self.frames.tick()
 
     def get_state(self):
         return self.state
 
     def handle_events(self):
-        for event in pygame.event.get():
+        for event in self.frames.get_events(idle=True):
             if event.type == pygame.QUIT:
                 self.state = "quit"
 
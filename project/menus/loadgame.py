@@ -1,20 +1,27 @@
 import pygame
-import os
+import time
 
 import paths
 import constants
 
 import pygame_gui
 
-import project.data as data
 import project.game.gui as GUI
+import project.game.journal as journal
+import project.game.delta as delta
+import project.game.savefile as savefile
+import project.game.saveindex as saveindex
+import project.game.thumbnail as thumbnail
+import project.scene as scene
+import project.scheduler as scheduler
 
 
-class LoadGame:
+class LoadGame(scene.Scene):
     """ Lets user select or delete games from a list of files from paths.GamePath """
     def __init__(self, display):
         self.display = display
         self.state = "load_game"
+        self.frames = scheduler.FrameScheduler()
         self.game_reference = None
 
         # Background Setup
@@ -42,12 +49,19 @@ class LoadGame:
                                                      paths.uiPath + "pageforward-hover.png",
                                                      860, 550)
 
-        self.run()
+    def enter(self):
+        self.state = "load_game"
+        self.game_reference = None
+        self.file_selector.refresh_list()  # games might have been made, played or won since the last visit
+
+    def exit(self):
+        self.reset_delete()
 
     def run(self):
         while self.state == "load_game":
-            self.handle_events()
             self.draw()
+            self.handle_events()
+            self.frames.tick()
 
     def get_state(self):
         return self.state
@@ -56,7 +70,7 @@ class LoadGame:
         return self.game_reference
 
     def handle_events(self):
-        for event in pygame.event.get():
+        for event in self.frames.get_events(idle=not thumbnail.thumbnails.is_busy()):  # draws thumbnails once made
             if event.type == pygame.QUIT:
                 self.state = "quit"
 
@@ -82,7 +96,11 @@ class LoadGame:
                             self.file_selector.page_forward()
 
     def delete_game(self):
-        data.delete(paths.gamePath + self.to_delete)
+        savefile.delete(paths.gamePath + self.to_delete)
+        journal.delete(self.to_delete)
+        delta.delete(self.to_delete)
+        saveindex.remove(self.to_delete)
+        thumbnail.delete(self.to_delete)
         self.file_selector.refresh_list()
         self.reset_delete()
 
@@ -115,88 +133,64 @@ class LoadGame:
         pygame.display.update()
 
 
-def remove_file_extension(filename):
-    return filename.split(".")[0]
-
-
-def get_game_files():
-    valid_game_files = []
-    folder_items = [file for file in os.listdir(paths.gamePath)]
-
-    for folder_item in folder_items:
-        if os.path.isfile(os.path.join(paths.gamePath, folder_item)) and folder_item.lower().endswith(".json"):
-            valid_game_files.append(folder_item)
-
-    return valid_game_files
-
-
 class FileSelector:
-    """ Responsible for the list of files seen on screen """
+    """ Responsible for the list of files seen on screen, only the slots of the page shown are made """
     def __init__(self, control, origin):
         self.control = control  # control being LoadGame Object
         self.origin = origin
-        self.max_amount = 6  # split into lists of amount (pages of so many games)
-
-        # Create game save directory if it doesn't exist.
-        os.makedirs(paths.gamePath, exist_ok=True)
+        self.max_amount = 6  # split into pages of so many games
 
-        # Load Game Names From Directory
-        self.games = sorted([remove_file_extension(file) for file in get_game_files()])
-        try:
-            self.games.remove(".gitignore")  # .gitignore present to stop data being pushed/pulled but still in directory.
-        except ValueError:
-            pass
-        self.split_games = [self.games[i:i + self.max_amount] for i in range(0, len(self.games), self.max_amount)]
-        # ^ splits games list into equal sub-lists of self.max_amount.
-
-        # GUI Setup
+        self.entries = {}  # {game name: saveindex entry}
+        self.games = []
         self.current_page = 0
-        self.game_pages = []
-        padding = 70  # space between file slots
-        for page in self.split_games:
-            self.game_pages.append([])
-            counter = 0
-            for game_name in page:
-                self.game_pages[len(self.game_pages)-1].append(
-                    GameSlot(self.control, game_name, [self.origin[0], self.origin[1] + padding*counter])
-                )
-                counter += 1
+        self.game_slots = []  # slots of the current page, filled by refresh_list
 
     def refresh_list(self):
-        self.__init__(self.control, self.origin)
+        self.entries = saveindex.get_entries()
+        self.games = sorted(self.entries)
+        self.current_page = min(self.current_page, self.get_page_count() - 1)
+        self.load_page()
+
+    def get_page_count(self):
+        return max(1, -(-len(self.games) // self.max_amount))  # rounded up, an empty page when no games
+
+    def load_page(self):
+        padding = 70  # space between file slots
+        start = self.current_page * self.max_amount
+        self.game_slots = [
+            GameSlot(self.control, game_name, self.entries[game_name],
+                     [self.origin[0], self.origin[1] + padding*counter])
+            for counter, game_name in enumerate(self.games[start:start + self.max_amount])]
 
     def check_clicked(self):
-        try:
-            for slot in self.game_pages[self.current_page]:
-                slot.handle_click()
-        except IndexError:  # no games in file
-            pass
+        for slot in self.game_slots:
+            slot.handle_click()
 
     def page_forward(self):
-        if self.current_page < len(self.game_pages)-1:
+        if self.current_page < self.get_page_count()-1:
             self.current_page += 1
         else:
             self.current_page = 0
+        self.load_page()
 
     def page_back(self):
         if self.current_page > 0:
             self.current_page -= 1
         else:
-            self.current_page = len(self.game_pages)-1
+            self.current_page = self.get_page_count()-1
+        self.load_page()
 
     def draw(self, display):
-        try:
-            for game_slot in self.game_pages[self.current_page]:
-                game_slot.draw(display)
-        except IndexError:  # in case there are no games.
-            pass
+        for game_slot in self.game_slots:
+            game_slot.draw(display)
 
 
 class GameSlot:
     """ A individual game slot, seen on the screen. managed by FileSelector"""
-    def __init__(self, control, game_name, position):
+    def __init__(self, control, game_name, entry, position):
         self.control = control  # Control in this case is the LoadGame object.
         self.game_name = game_name
+        self.entry = entry  # from project.game.saveindex
         self.position = position
 
         # GUI Setup
@@ -210,7 +204,12 @@ class GameSlot:
         self.text = pygame_gui.Text(
             game_name,
             constants.FONTS["sizes"]["medium"], constants.FONTS["colour"], constants.FONTS["main"],
-            self.position[0] + 50, self.position[1] + 15)
+            self.position[0] + 50, self.position[1] + 5)
+        self.details_text = pygame_gui.Text(
+            "%s, turn %s: %s   %s" % (entry["map"], entry["turn"], ", ".join(entry["players"]),
+                                     time.strftime("%d %b %H:%M", time.localtime(entry["modified"]))),
+            constants.FONTS["sizes"]["small"], constants.FONTS["colour"], constants.FONTS["main"],
+            self.position[0] + 50, self.position[1] + 27)
 
         self.quit_button = pygame_gui.Button(paths.uiPath + "cross.png",
                                              paths.uiPath + "cross-hover.png",
@@ -232,5 +231,9 @@ class GameSlot:
         else:
             self.back_panel.draw(display)
 
+        picture = thumbnail.thumbnails.get(self.game_name, self.entry["modified"])
+        if picture is not None:
+            display.blit(picture, [self.position[0] + 2, self.position[1] + 2])
         self.text.draw(display)
+        self.details_text.draw(display)
         self.quit_button.draw(display)
@@ -5,13 +5,16 @@ import paths
 import constants
 
 import pygame_gui
+import project.scene as scene
+import project.scheduler as scheduler
 
 
-class Menu:
+class Menu(scene.Scene):
     """ top section for user to pick state. new_game, leaderboard ..."""
     def __init__(self, display):
         self.display = display
         self.state = "menu"
+        self.frames = scheduler.FrameScheduler()
         self.game_reference = None
 
         # Background Setup
@@ -66,18 +69,23 @@ class Menu:
         self.show_about = False
         self.about = About(self)
 
-        self.run()
+    def enter(self):
+        self.state = "menu"
+
+    def exit(self):
+        self.show_about = False  # closed when coming back
 
     def run(self):
         while self.state == "menu":
+            self.draw()  # drawn before waiting on input, so idle scenes are up to date while they wait
             self.handle_events()
-            self.draw()
+            self.frames.tick()
 
     def get_state(self):
         return self.state
 
     def handle_events(self):
-        for event in pygame.event.get():
+        for event in self.frames.get_events(idle=True):  # nothing animates, only redraw on input
             if event.type == pygame.QUIT:
                 self.state = "quit"
 
@@ -133,8 +141,7 @@ class WebLink:
             text,
             constants.FONTS["sizes"]["medium"], constants.FONTS["colour"], constants.FONTS["main"],
             x, y)
-        self.hover_text.graphic_font.set_underline(True)
-        self.hover_text.change_text(self.hover_text.text)  # acts as update, font must be re-rendered to show underline.
+        self.hover_text.set_underline(True)
 
     def mouse_over(self):
         return self.rect.collidepoint(pygame.mouse.get_pos())
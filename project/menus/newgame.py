@@ -8,14 +8,18 @@ import constants
 import pygame_gui
 
 import project.game.new as new
-import project.data as data
+import project.game.journal as journal
+import project.game.savefile as savefile
+import project.scene as scene
+import project.scheduler as scheduler
 
 
-class NewGame:
+class NewGame(scene.Scene):
     """ allows the user to setup and start a new game """
     def __init__(self, display):
         self.display = display
         self.state = "new_game"
+        self.frames = scheduler.FrameScheduler()
         self.game_reference = None
 
         # Background Setup
@@ -77,12 +81,23 @@ class NewGame:
 
         self.player_manager = PlayerManager(4, [self.origin[0] + 100, self.origin[1] + 290])
 
-        self.run()
+    def enter(self):  # starts with an empty form, as a new menu would
+        self.state = "new_game"
+        self.game_reference = None
+        self.game_name_input.text.change_text("")
+        self.game_name_error_text.change_text("")
+        self.player_slots_error.change_text("")
+        self.player_manager.clear()
+
+    def exit(self):
+        self.game_name_input.active = False  # so typing doesn't go to it on the next visit
+        self.game_name_input.backspace = False
 
     def run(self):
         while self.state == "new_game":
-            self.handle_events()
             self.draw()
+            self.handle_events()
+            self.frames.tick()
 
     def create_game(self):
         self.player_slots_error.change_text("")
@@ -107,10 +122,15 @@ class NewGame:
             return False
 
         # Game/File name doesn't exist
-        if data.check_exists(paths.gamePath + self.game_name_input.get_text()):
+        if savefile.exists(paths.gamePath + self.game_name_input.get_text()):
             self.game_name_error_text.change_text("Sorry this name is already taken!")
             return False
 
+        # Name isn't kept by a finished game's replay
+        if journal.can_replay(self.game_name_input.get_text()):
+            self.game_name_error_text.change_text("Sorry this name is taken by a finished game!")
+            return False
+
         # More than 1 player
         if not self.player_manager.enough_players():
             self.player_slots_error.change_text("There must be more than 1 player to play!")
@@ -134,8 +154,11 @@ class NewGame:
     def get_game(self):
         return self.game_reference
 
+    def is_idle(self):
+        return not self.game_name_input.backspace and not self.player_manager.is_editing()  # held backspace repeats
+
     def handle_events(self):
-        for event in pygame.event.get():
+        for event in self.frames.get_events(idle=self.is_idle()):
             if event.type == pygame.QUIT:
                 self.state = "quit"
 
@@ -197,6 +220,11 @@ class PlayerManager:
         self.slot_size = [200, 30]
         self.slot_padding = 40
 
+    def clear(self):
+        for player in list(self.players):
+            self.colour_manager.add_colour(player.colour)
+        self.players = []
+
     def enough_players(self):
         if len(self.players) > 1:
             return True
@@ -219,7 +247,7 @@ class PlayerManager:
         return [self.origin[0], self.origin[1] + ((self.slot_size[1] + self.slot_padding) * slot_number)]
 
     def add_player(self):
-        self.players.append(PlayerSlot(self, self.get_slot_bottom(), self.colour_manager.get_colour(), ""))
+        self.players.append(PlayerSlot(self, self.get_slot_bottom(), self.colour_manager.get_colour(), "", None))
 
     def delete_player(self, player):
         self.colour_manager.add_colour(player.colour)  # so the colour can be re-used again.
@@ -231,7 +259,7 @@ class PlayerManager:
         self.players = []
         for player_slot in old_slots:  # allows slots to auto move up if an above slot is deleted.
             self.players.append(PlayerSlot(self, self.get_slot_bottom(),
-                                           player_slot.colour, player_slot.name_entry.text.text))
+                                           player_slot.colour, player_slot.name_entry.text.text, player_slot.ai))
 
     def handle_click(self):
         added = False
@@ -244,6 +272,9 @@ class PlayerManager:
             for player in self.players:
                 player.handle_click()
 
+    def is_editing(self):
+        return any(player.name_entry.backspace for player in self.players)
+
     def handle_event(self, event):
         for player in self.players:
             player.handle_event(event)
@@ -264,10 +295,11 @@ class PlayerManager:
 
 class PlayerSlot:
     """ a single slot seen in the PlayerManager """
-    def __init__(self, player_manager,  origin, colour, name=""):
+    def __init__(self, player_manager,  origin, colour, name="", ai=None):
         self.player_manager = player_manager
         self.origin = origin
         self.colour = colour
+        self.ai = ai  # computer player difficulty, None for a person
 
         # Background
         self.back_panel = pygame_gui.Panel([self.origin[0], self.origin[1], 500, 50], 100, constants.COLOURS["black"])
@@ -282,13 +314,30 @@ class PlayerSlot:
         self.delete_self = pygame_gui.Button(paths.uiPath + "cross.png", paths.uiPath + "cross-hover.png",
                                              self.origin[0]+430, self.origin[1]+8)
 
+        self.ai_button = self.get_ai_button()
+
     def get_dict(self):
-        return {"name": self.name_entry.get_text(), "colour": self.colour}
+        return {"name": self.name_entry.get_text(), "colour": self.colour, "ai": self.ai}
+
+    def get_ai_button(self):
+        return pygame_gui.TextButton([self.origin[0]+365, self.origin[1]+10, 60, 30], 0, 100,
+                                     self.ai if self.ai is not None else "person",
+                                     constants.FONTS["sizes"]["medium"], constants.FONTS["colour"],
+                                     constants.FONTS["main"])
+
+    def change_ai(self):  # cycles person, then each difficulty of computer player
+        choices = [None] + list(constants.AI_DIFFICULTIES)
+        self.ai = choices[(choices.index(self.ai) + 1) % len(choices)]
+        self.ai_button = self.get_ai_button()
 
     def handle_click(self):
         if self.name_entry.check_clicked():
             return True
 
+        elif self.ai_button.check_clicked():
+            self.change_ai()
+            return True
+
         elif self.delete_self.check_clicked():
             self.player_manager.delete_player(self)
             return True
@@ -307,6 +356,7 @@ class PlayerSlot:
         self.back_panel.draw(display)
         self.name_entry.draw(display)
         pygame.draw.ellipse(display, constants.COLOURS[self.colour], [self.origin[0]+330, self.origin[1]+10, 28, 28])
+        self.ai_button.draw(display)
         self.delete_self.draw(display)
 
 
@@ -389,6 +439,5 @@ class MapSelector:
 class SlotButton(pygame_gui.Button):
     """ Specific to PlayerManager, button must change position depending on number of slots """
     def change_position(self, position):
-        self.rect.topleft = position
-        self.rest_image.rect.topleft = position
-        self.hover_image.rect.topleft = position
+        self.rest_image.set_position(position)  # also the button's rect
+        self.hover_image.set_position(position)
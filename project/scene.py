@@ -0,0 +1,8 @@
+class Scene:
+    """ a section of the application, ie a menu, kept by project.control.SceneManager between visits.
+    enter() is called each time it is switched to, before run(), and exit() each time it is left """
+    def enter(self):
+        pass
+
+    def exit(self):
+        pass
@@ -0,0 +1,33 @@
+import pygame
+
+import constants
+
+
+class FrameScheduler:
+    """ paces a scene loop to a target fps, blocking on events instead of redrawing when the scene is idle """
+    def __init__(self, fps=constants.FPS, idle_timeout=constants.IDLE_TIMEOUT):
+        self.clock = pygame.time.Clock()
+        self.fps = fps
+        self.idle_timeout = idle_timeout  # ms, max wait for an event before a frame is drawn anyway
+        self.frame_time = 0
+
+    def set_fps(self, fps):
+        self.fps = fps
+
+    def get_events(self, idle=False):
+        # when idle nothing changes between events, so sleep until one arrives rather than spinning.
+        if idle:
+            event = pygame.event.wait(self.idle_timeout)
+            if event.type != pygame.NOEVENT:
+                return [event] + pygame.event.get()
+        return pygame.event.get()
+
+    def tick(self):
+        self.frame_time = self.clock.tick(self.fps)  # sleeps the remainder of the frame, 0 fps is uncapped
+        return self.frame_time
+
+    def get_frame_time(self):
+        return self.frame_time  # ms taken by the last frame, including any idle wait
+
+    def get_fps(self):
+        return self.clock.get_fps()  # averaged over the last few frames
@@ -2,13 +2,10 @@ import pygame
 import pygame_gui.image
 
 
-class Button:
+class Button(pygame_gui.image.RestImageRect):
     def __init__(self, rest_image, hover_image, x, y):
         self.rest_image = pygame_gui.Image(rest_image, x, y)
         self.hover_image = pygame_gui.Image(hover_image, x, y)
-        self.rect = self.rest_image.image.get_rect()
-        self.rect.x = x
-        self.rect.y = y
         self.function = None
 
     def set_function(self, function):
@@ -2,15 +2,12 @@ import pygame
 import pygame_gui.image
 
 
-class Checkbox:
+class Checkbox(pygame_gui.image.RestImageRect):
     def __init__(self, rest_image, hover_image, active_image, active_hover_image, x, y):
         self.rest_image = pygame_gui.Image(rest_image, x, y)
         self.hover_image = pygame_gui.Image(hover_image, x, y)
         self.active_image = pygame_gui.Image(active_image, x, y)
         self.active_hover_image = pygame_gui.Image(active_hover_image, x, y)
-        self.rect = self.rest_image.image.get_rect()
-        self.rect.x = x
-        self.rect.y = y
         self.active = False
 
     def mouse_over(self):
@@ -3,7 +3,7 @@ import pygame_gui.text
 import pygame_gui.image
 
 
-class Entry:
+class Entry(pygame_gui.image.RestImageRect):
     def __init__(self, rest_image, hover_image,
                  rest_focused_image, hover_focused_image,
                  initial_text, text_size, text_colour, text_font, text_padx, text_pady,
@@ -14,15 +14,12 @@ class Entry:
         self.rest_focused_image = pygame_gui.Image(rest_focused_image, x, y)
         self.hover_focused_image = pygame_gui.Image(hover_focused_image, x, y)
 
-        self.rect = self.rest_image.image.get_rect()
-        self.rect.x = x
-        self.rect.y = y
         self.text_padx = text_padx
         self.text_pady = text_pady
         self.active = False
         self.sticky = sticky  # sticky if text should remain when entry re-clicked on.
         self.text = pygame_gui.Text(initial_text, text_size, text_colour, text_font,
-                                    self.rect.x+self.text_padx, self.rect.y+self.text_pady)
+                                    x+self.text_padx, y+self.text_pady)
         self.backspace = False  # allows for continuous backspace. (as long as handle_event_up() is also called)
         self.backspace_delay = 7  # READ ME!! - works as delayed by x frames, for higher frame rates increase delay.
         self.backspace_counter = 0
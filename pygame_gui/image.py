@@ -1,12 +1,38 @@
-import pygame
+import weakref
+import pygame_gui.resources
 
 
 class Image:
     def __init__(self, image_ref, x, y):
-        self.image = pygame.image.load(image_ref).convert_alpha()
-        self.rect = self.image.get_rect()
-        self.rect.x = x
-        self.rect.y = y
+        self.image_ref = image_ref
+        self.position = [x, y]
+        self._rect = None  # made on first use, as it needs the image loaded
+
+        pygame_gui.resources.acquire_image(image_ref)
+        weakref.finalize(self, pygame_gui.resources.release_image, image_ref)  # once this Image is collected
+
+    @property
+    def image(self):
+        return pygame_gui.resources.get_image(self.image_ref)
+
+    @property
+    def rect(self):
+        if self._rect is None:
+            self._rect = self.image.get_rect().move(self.position)
+        return self._rect
+
+    def set_position(self, position):
+        """ moves the image, without loading it if it hasn't been yet """
+        self.position = list(position)
+        if self._rect is not None:
+            self._rect.topleft = position
 
     def draw(self, display):
         display.blit(self.image, self.rect.topleft)
+
+
+class RestImageRect:
+    """ for widgets drawn from several Images, their rect is rest_image's, so images are only loaded once needed """
+    @property
+    def rect(self):
+        return self.rest_image.rect
@@ -0,0 +1,25 @@
+import pygame
+
+
+images = {}  # path: [surface, or None until first used, number of Images using it], shared by every Image of path
+
+
+def acquire_image(path):
+    """ counts a new user of the image at path, which isn't loaded until get_image first needs it """
+    if path not in images:
+        images[path] = [None, 0]
+    images[path][1] += 1
+
+
+def release_image(path):
+    images[path][1] -= 1
+    if images[path][1] == 0:
+        del images[path]  # nothing uses it, so the surface can be freed
+
+
+def get_image(path):
+    """ surfaces are shared between Images, so must not be drawn on """
+    image = images[path]
+    if image[0] is None:
+        image[0] = pygame.image.load(path).convert_alpha()
+    return image[0]
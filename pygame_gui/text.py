@@ -1,6 +1,29 @@
+import functools
 import pygame
 
 
+fonts = {}  # (font, size): pygame.font.Font, shared by every Text using that font
+
+
+def get_font(font, size):
+    if (font, size) not in fonts:
+        try:
+            fonts[(font, size)] = pygame.font.Font(font, size)
+        except OSError:  # can't read font file.
+            fonts[(font, size)] = pygame.font.SysFont(font, size)
+    return fonts[(font, size)]
+
+
+@functools.lru_cache(maxsize=512)
+def render_text(text, size, colour, font, underline=False):
+    """ rendered text surfaces are shared between Text objects, so must not be drawn on """
+    graphic_font = get_font(font, size)
+    graphic_font.set_underline(underline)  # font is shared, so underline only set for this render.
+    graphic_text = graphic_font.render(text, True, colour)
+    graphic_font.set_underline(False)
+    return graphic_text
+
+
 class Text:
     def __init__(self, text, size, colour, font, x, y):
         self.text = text
@@ -9,17 +32,15 @@ class Text:
         self.size = size
         self.colour = colour
         self.font = font
+        self.underline = False
         self._config_font()
         self._config_text()
 
     def _config_font(self):
-        try:
-            self.graphic_font = pygame.font.Font(self.font, self.size)
-        except OSError:  # can't read font file.
-            self.graphic_font = pygame.font.SysFont(self.font, self.size)
+        self.graphic_font = get_font(self.font, self.size)
 
     def _config_text(self):
-        self.graphic_text = self.graphic_font.render(self.text, True, self.colour)
+        self.graphic_text = render_text(self.text, self.size, tuple(self.colour), self.font, self.underline)
         self.rect = self.graphic_text.get_rect().move(self.x, self.y)
 
     def get_rect(self):
@@ -27,6 +48,10 @@ class Text:
 
     def change_text(self, text):
         self.text = text
+        self._config_text()  # cheap if this text has been rendered before
+
+    def set_underline(self, underline):
+        self.underline = underline
         self._config_text()
 
     def draw(self, display):
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+# Replays a game from its journal, stepping forwards and backwards through every command made.
+# Journals are kept next to saves (data/saved/<game>.journal), including after a game is won.
+
+import argparse
+
+import pygame
+
+import constants
+import project.game.journal as journal
+import project.game.replay as replay
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a game from its journal.")
+    parser.add_argument("game", help="name of the game to replay")
+    args = parser.parse_args()
+    if not journal.can_replay(args.game):
+        parser.error("no journal for %s, only games played since journals were added can be replayed" % args.game)
+
+    pygame.init()
+    display = pygame.display.set_mode(constants.DISPLAY_SIZE)
+    pygame.display.set_caption(constants.DISPLAY_NAME + " - Replay: " + args.game)
+
+    replay.ReplayViewer(display, args.game).run()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# Plays many computer player games in parallel without a display, for balancing unit specs and city levels.
+# Each finished game is written as soon as it ends, as a csv row or json line depending on the output's extension.
+
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+
+import project.game.engine as engine
+import project.game.ai as ai
+import project.game.commands as commands
+import constants
+import paths
+
+PLAYER_COLOURS = ["blue", "yellow", "green", "red"]
+GAME_FIELDS = ["map", "lineup", "seed", "winner", "winner_ai", "turns"]
+PLAYER_FIELDS = ["ai", "score", "max_score", "units_spawned", "cities_conquered"]
+
+
+def main():
+    maps = sorted(filename.replace(".csv", "") for filename in os.listdir(paths.mapPath))  # all files are .csv
+
+    parser = argparse.ArgumentParser(description="Play computer player games in parallel, without a display.")
+    parser.add_argument("output", help="file to write results to, .csv or .jsonl")
+    parser.add_argument("--maps", nargs="+", default=maps, help="maps to play on (default: every map)")
+    parser.add_argument("--lineups", nargs="+", default=["easy,normal", "normal,hard", "easy,normal,hard"],
+                        help="comma separated difficulties of the players in each game, ie easy,hard")
+    parser.add_argument("--seeds", type=int, default=10, help="games per map and lineup, seeded 0 to seeds - 1")
+    budget = parser.add_mutually_exclusive_group()
+    budget.add_argument("--nodes", type=int, help="evaluations of search per turn, instead of each difficulty's")
+    budget.add_argument("--budget", type=float,
+                        help="seconds of search per turn instead, games then vary with the machine and its load")
+    parser.add_argument("--max-turns", type=int, default=200, help="turns each player gets before a draw")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="games played at once")
+    args = parser.parse_args()
+
+    lineups = [lineup.split(",") for lineup in args.lineups]
+    for lineup in lineups:
+        if not 1 < len(lineup) <= len(PLAYER_COLOURS):
+            parser.error("a lineup needs 2 to %s players" % len(PLAYER_COLOURS))
+        for difficulty in lineup:
+            if difficulty not in constants.AI_DIFFICULTIES:
+                parser.error("unknown difficulty %s, choose from %s" % (difficulty,
+                                                                        ", ".join(constants.AI_DIFFICULTIES)))
+    for map_name in args.maps:
+        if map_name not in maps:
+            parser.error("unknown map %s" % map_name)
+
+    games = [{"map": map_name, "lineup": lineup, "seed": seed, "budget": args.budget, "nodes": args.nodes,
+              "max_turns": args.max_turns}
+             for map_name in args.maps for lineup in lineups for seed in range(args.seeds)]
+
+    with open(args.output, "w", newline="") as file:
+        writer = get_writer(file, args.output)
+        with multiprocessing.Pool(args.workers) as pool:
+            for played, result in enumerate(pool.imap_unordered(play_game, games), 1):
+                writer(result)
+                file.flush()  # so results can be read while the rest are played
+                print("%s/%s %s %s seed %s: %s after %s turns" % (
+                    played, len(games), result["map"], result["lineup"], result["seed"],
+                    result["winner"] or "draw", result["turns"]))
+
+
+def get_writer(file, filename):
+    """ function writing one result to file, as a json line or a flattened csv row """
+    if filename.endswith(".jsonl"):
+        return lambda result: file.write(json.dumps(result) + "\n")
+
+    fields = GAME_FIELDS + ["p%s_%s" % (number, field)
+                            for number in range(1, len(PLAYER_COLOURS) + 1) for field in PLAYER_FIELDS]
+    writer = csv.DictWriter(file, fields)
+    writer.writeheader()
+
+    def write(result):
+        row = {field: result[field] for field in GAME_FIELDS}
+        for number, player in enumerate(result["players"], 1):
+            for field in PLAYER_FIELDS:
+                row["p%s_%s" % (number, field)] = player[field]
+        writer.writerow(row)
+    return write
+
+
+def play_game(game):
+    """ plays one game between computer players to the end, or max_turns, returning its result """
+    players = [{"name": "p%s" % number, "colour": colour, "ai": difficulty}
+               for number, (difficulty, colour) in enumerate(zip(game["lineup"], PLAYER_COLOURS), 1)]
+    game_engine = engine.make(game["map"], players, "tournament", game["seed"])  # seeds spawns and city names
+    game_model = game_engine.get_model()
+
+    spawned = {player["name"]: 0 for player in players}
+    conquered = {player["name"]: 0 for player in players}
+    while not game_model.game_ended() and game_model.get_current_player().get_turn() < game["max_turns"]:
+        player = game_model.get_current_player()
+        nodes = game["nodes"]
+        if nodes is None and game["budget"] is None:  # searched by evaluations, so seeded games always play the same
+            nodes = constants.AI_DIFFICULTIES[player.get_ai()]["nodes"]
+        for command in ai.plan_turn(game_model.get_save_data(), player.get_ai(), game["budget"], nodes):
+            if game_engine.apply(command):
+                if isinstance(command, commands.Spawn):
+                    spawned[player.get_name()] += 1
+                elif isinstance(command, commands.Conquer):
+                    conquered[player.get_name()] += 1
+
+    winner = game_model.get_winner() if game_model.game_ended() else None
+    return {
+        "map": game["map"],
+        "lineup": ",".join(game["lineup"]),
+        "seed": game["seed"],
+        "winner": winner,
+        "winner_ai": game_model.get_player(winner).get_ai() if winner is not None else None,
+        "turns": max(player.get_turn() for player in game_model.players),
+        "players": [{
+            "name": player.get_name(),
+            "ai": player.get_ai(),
+            "score": player.get_score(),  # also brings max_score up to date
+            "max_score": player.get_max_score(),
+            "units_spawned": spawned[player.get_name()],
+            "cities_conquered": conquered[player.get_name()],
+        } for player in game_model.players],
+    }
+
+
+if __name__ == "__main__":
+    main()